@@ -0,0 +1,137 @@
+"""
+Asset Loader - Manifest-driven asset loading on a thread pool
+
+Purpose: Stop freezing the screen while a level's files are read and decoded
+one by one on the main thread. Files are read and decoded on worker threads,
+and the main thread only does what must happen there (display-format
+conversion, registering results) a few milliseconds per frame, so the caller
+can keep drawing a progress bar.
+
+Manifest: a list of (kind, path) items
+- 'csv':   map layout, parsed on a worker
+- 'image': decoded on a worker unless the pixel cache already has it,
+           converted on the main thread
+- 'sound': loaded on a worker unless the AssetRegistry already has it
+- 'atlas': atlas category (path is the category name); its saved sheet is
+           decoded on a worker like an image, then the atlas is set up (or
+           rebuilt if stale) on the main thread
+
+Algorithm:
+1. start() submits the worker half of every item at once
+2. update() finishes items in manifest order, for up to
+   ASSET_LOADER_FRAME_BUDGET_MS per call
+3. progress is the fraction of finished items; done once all are finished
+
+Results go into the caches the game already reads from (preloaded CSV
+layouts, the pixel cache, the AssetRegistry and the atlases), so building the
+level afterwards touches no files. An item whose worker job fails is skipped;
+the normal load path reports the error when the asset is actually used.
+"""
+
+import os
+from collections import deque
+from concurrent.futures import ThreadPoolExecutor
+from time import perf_counter
+import pygame
+from settings import ASSET_LOADER_WORKERS, ASSET_LOADER_FRAME_BUDGET_MS
+from support import read_csv_layout, preload_csv_layout
+from pixel_cache import shared_cache
+from asset_registry import AssetRegistry
+from atlas import load_atlas, atlas_sheet_path
+
+
+class AssetLoader:
+
+    def __init__(self, manifest, workers=ASSET_LOADER_WORKERS):
+        """
+        Args:
+            manifest: Iterable of (kind, path) items (see module docstring)
+            workers: Number of worker threads
+        """
+        self.manifest = list(manifest)
+        self.workers = workers
+        self.total = len(self.manifest)
+        self.completed = 0
+
+        self._executor = None
+        self._pending = deque()  # (kind, path, future or None), manifest order
+
+        self.stats = {'decoded': 0, 'cached': 0, 'failed': 0}
+
+    def start(self):
+        # Submit the worker half of every manifest item.
+        self._executor = ThreadPoolExecutor(max_workers=self.workers, thread_name_prefix='asset-loader')
+        for kind, path in self.manifest:
+            self._pending.append((kind, path, self._submit(kind, path)))
+
+    def _submit(self, kind, path):
+        # Background job for an item, or None if it has none.
+        if kind == 'csv':
+            return self._executor.submit(read_csv_layout, path)
+        if kind == 'image':
+            if shared_cache.contains(path):
+                self.stats['cached'] += 1
+                return None
+            return self._executor.submit(shared_cache.decode, path)
+        if kind == 'sound':
+            if AssetRegistry.has_sound(path):
+                self.stats['cached'] += 1
+                return None
+            return self._executor.submit(pygame.mixer.Sound, path)
+        if kind == 'atlas':
+            sheet_path = atlas_sheet_path(path)
+            if shared_cache.contains(sheet_path) or not os.path.exists(sheet_path):
+                return None
+            return self._executor.submit(shared_cache.decode, sheet_path)
+        return None
+
+    def _finish(self, kind, path, result):
+        # Main-thread half: conversion and handing the result to its cache.
+        if kind == 'csv':
+            preload_csv_layout(path, result)
+        elif kind == 'image':
+            shared_cache.preload(path, *result)
+            self.stats['decoded'] += 1
+        elif kind == 'sound':
+            AssetRegistry.preload_sound(path, result)
+        elif kind == 'atlas':
+            if result is not None:
+                shared_cache.preload(atlas_sheet_path(path), *result)
+            load_atlas(path)
+
+    def update(self, budget_ms=ASSET_LOADER_FRAME_BUDGET_MS):
+        # Finish ready items in manifest order until the time budget is spent.
+        deadline = perf_counter() + budget_ms / 1000
+        while self._pending:
+            kind, path, future = self._pending[0]
+            if future is not None and not future.done():
+                break
+            self._pending.popleft()
+
+            if future is not None:
+                try:
+                    self._finish(kind, path, future.result())
+                except (OSError, ValueError, pygame.error):
+                    self.stats['failed'] += 1
+            elif kind == 'atlas':
+                self._finish(kind, path, None)
+            self.completed += 1
+
+            if perf_counter() >= deadline:
+                break
+
+        if not self._pending:
+            self.shutdown()
+
+    @property
+    def progress(self):
+        return self.completed / self.total if self.total else 1.0
+
+    @property
+    def done(self):
+        return self.completed == self.total
+
+    def shutdown(self):
+        if self._executor is not None:
+            self._executor.shutdown(wait=False, cancel_futures=True)
+            self._executor = None
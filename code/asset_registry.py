@@ -0,0 +1,125 @@
+import pygame
+from settings import weapon_data
+from support import import_folder, load_image
+
+
+class AssetRegistry:
+    """
+    Process-wide cache for assets that many sprites share.
+
+    Monster animations are keyed by monster name, weapon images by weapon
+    name and sounds by file path.
+    Each asset is decoded once and every caller receives the same object,
+    so load time and memory no longer scale with the number of enemies.
+
+    Shared surfaces must be treated as read-only: sprites that need a
+    modified frame (e.g. the invulnerability flicker) swap to one of the
+    pre-baked variants instead of changing surface state.
+    """
+
+    _monster_animations = {}
+    _flicker_animations = {}
+    _blank_surfaces = {}
+    _weapon_images = {}
+    _sounds = {}
+
+    WEAPON_DIRECTIONS = ('up', 'down', 'left', 'right')
+
+    @classmethod
+    def monster_animations(cls, name):
+        # Return the shared {'idle', 'move', 'attack'} frame lists for a monster type.
+        animations = cls._monster_animations.get(name)
+        if animations is None:
+            main_path = f'graphics/monsters/{name}/'
+            animations = {}
+            for animation in ('idle', 'move', 'attack'):
+                animations[animation] = import_folder(main_path + animation)
+            cls._monster_animations[name] = animations
+        return animations
+
+    @classmethod
+    def flicker_animations(cls, key, animations, alpha=0):
+        """
+        Return alpha-reduced copies of an animation set, baked once per key.
+
+        At alpha 0 nothing would be drawn, so every frame maps to one shared
+        transparent surface of its size instead of a baked copy.
+
+        Args:
+            key: Cache key (e.g. 'monster:eye' or 'player')
+            animations: {status: [frames]} to derive the variants from
+            alpha: Opacity (0-255) baked into the per-pixel alpha of each copy
+
+        Returns:
+            {status: [frames]} matching the layout of animations
+        """
+        flicker = cls._flicker_animations.get((key, alpha))
+        if flicker is None:
+            bake = cls._blank if alpha == 0 else lambda frame: cls._bake_alpha(frame, alpha)
+            flicker = {status: [bake(frame) for frame in frames]
+                       for status, frames in animations.items()}
+            cls._flicker_animations[(key, alpha)] = flicker
+        return flicker
+
+    @classmethod
+    def _blank(cls, frame):
+        # Shared fully transparent surface with the frame's size (keeps rects and hitboxes unchanged).
+        size = frame.get_size()
+        blank = cls._blank_surfaces.get(size)
+        if blank is None:
+            blank = pygame.Surface(size, pygame.SRCALPHA)
+            cls._blank_surfaces[size] = blank
+        return blank
+
+    @staticmethod
+    def _bake_alpha(frame, alpha):
+        # Scale per-pixel alpha so the copy blits like set_alpha(alpha) without surface alpha.
+        baked = frame.copy()
+        baked.fill((255, 255, 255, alpha), special_flags=pygame.BLEND_RGBA_MULT)
+        return baked
+
+    @classmethod
+    def weapon_images(cls, name):
+        # Return the shared {'up', 'down', 'left', 'right', 'full'} surfaces for a weapon.
+        images = cls._weapon_images.get(name)
+        if images is None:
+            images = {direction: load_image(f'graphics/weapons/{name}/{direction}.png')
+                      for direction in cls.WEAPON_DIRECTIONS}
+            images['full'] = load_image(weapon_data[name]['graphic'])
+            cls._weapon_images[name] = images
+        return images
+
+    @classmethod
+    def preload_weapons(cls):
+        # Load every weapon up front so attacks never touch the disk.
+        for name in weapon_data:
+            cls.weapon_images(name)
+
+    @classmethod
+    def has_sound(cls, path):
+        return path in cls._sounds
+
+    @classmethod
+    def preload_sound(cls, path, sound):
+        # Register a Sound loaded elsewhere (e.g. on an AssetLoader worker).
+        cls._sounds.setdefault(path, sound)
+
+    @classmethod
+    def sound(cls, path, volume=None):
+        # Return the shared Sound for a file path, loading it on first use.
+        sound = cls._sounds.get(path)
+        if sound is None:
+            sound = pygame.mixer.Sound(path)
+            cls._sounds[path] = sound
+        if volume is not None:
+            sound.set_volume(volume)
+        return sound
+
+    @classmethod
+    def clear(cls):
+        # Drop all cached assets (e.g. after the display mode changes).
+        cls._monster_animations.clear()
+        cls._flicker_animations.clear()
+        cls._blank_surfaces.clear()
+        cls._weapon_images.clear()
+        cls._sounds.clear()
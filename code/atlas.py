@@ -0,0 +1,200 @@
+"""
+Texture Atlas - Animation frames packed into one trimmed sheet per category
+
+Purpose: Load player, monster and particle frames with one image decode per
+category instead of one per file, keep each category's pixels together in
+memory, and blit only the opaque part of every frame.
+
+Algorithm:
+1. Build (first run, or whenever a source image is added, removed or changed):
+   - every PNG under a category root (ATLAS_CATEGORIES) is trimmed to the
+     bounding box of its non-transparent pixels
+   - the trimmed frames are shelf-packed, tallest first, into a sheet
+     ATLAS_SHEET_WIDTH pixels wide
+   - the sheet is saved to CACHE_DIR/atlas/<category>.png next to an index
+     of per-frame sheet rect, trim offset and untrimmed size
+2. Runtime: the sheet is decoded once and each folder's frames are handed out
+   as subsurfaces of it, in the same order import_folder lists the files.
+
+Frames come as a FrameList: a list of surfaces that also carries, per frame,
+the offset of the trimmed image inside the original frame and the original
+size. Sprites keep rects of the original size (so hitboxes, centers and the
+Y-sort are unchanged) and draw the image at rect.topleft + offset.
+
+Run this module directly to (re)build every atlas ahead of time.
+"""
+
+import os
+import pygame
+from settings import CACHE_DIR, ATLAS_CATEGORIES, ATLAS_SHEET_WIDTH
+from pixel_cache import load_image
+
+
+class FrameList(list):
+    # Animation frames plus per-frame trim offsets and untrimmed sizes.
+
+    def __init__(self, frames=(), offsets=None, sizes=None):
+        super().__init__(frames)
+        self.offsets = offsets if offsets is not None else [(0, 0)] * len(self)
+        self.sizes = sizes if sizes is not None else [frame.get_size() for frame in self]
+
+
+class TextureAtlas:
+
+    def __init__(self, category, root, sheet_width=ATLAS_SHEET_WIDTH):
+        self.category = category
+        self.root = os.path.normpath(root)
+        self.sheet_width = sheet_width
+        self.sheet_path = os.path.join(CACHE_DIR, 'atlas', f'{category}.png')
+        self.index_path = os.path.join(CACHE_DIR, 'atlas', f'{category}.txt')
+
+        self.sheet = None
+        self.folders = {}  # folder -> FrameList
+
+    def _sources(self):
+        # (folder, file name, mtime) of every frame, in import_folder order.
+        sources = []
+        for folder, _, files in os.walk(self.root):
+            for name in files:
+                if name.lower().endswith('.png'):
+                    path = os.path.join(folder, name)
+                    sources.append((os.path.normpath(folder), name, int(os.path.getmtime(path))))
+        return sources
+
+    def _read_index(self, sources):
+        # Parsed index entries if the saved atlas matches the sources, else None.
+        try:
+            with open(self.index_path) as index_file:
+                lines = index_file.read().splitlines()
+        except OSError:
+            return None
+        entries = []
+        try:
+            for line in lines:
+                folder, name, mtime, sheet_rect, offset, size = line.split('\t')
+                entry = ((folder, name, int(mtime)),
+                         tuple(int(value) for value in sheet_rect.split()),
+                         tuple(int(value) for value in offset.split()),
+                         tuple(int(value) for value in size.split()))
+                if tuple(map(len, entry[1:])) != (4, 2, 2):
+                    raise ValueError(line)
+                entries.append(entry)
+        except ValueError:
+            return None  # Damaged index: rebuild
+        if [entry[0] for entry in entries] != sources or not os.path.exists(self.sheet_path):
+            return None
+        return entries
+
+    def _pack(self, sources):
+        """
+        Trim and shelf-pack all source frames into one sheet.
+
+        Returns:
+            (sheet surface, index entries like _read_index)
+        """
+        trimmed = []
+        for source in sources:
+            folder, name, _ = source
+            image = pygame.image.load(os.path.join(folder, name)).convert_alpha()
+            bounds = image.get_bounding_rect()
+            if bounds.width == 0 or bounds.height == 0:
+                bounds = pygame.Rect(0, 0, 1, 1)  # Fully transparent frame
+            trimmed.append((source, image, bounds))
+
+        # Shelves left to right, tallest frames first
+        placements = {}
+        x = y = shelf_height = 0
+        for index in sorted(range(len(trimmed)), key=lambda index: -trimmed[index][2].height):
+            width, height = trimmed[index][2].size
+            if x + width > self.sheet_width:
+                x = 0
+                y += shelf_height
+                shelf_height = 0
+            placements[index] = (x, y)
+            x += width
+            shelf_height = max(shelf_height, height)
+
+        sheet = pygame.Surface((self.sheet_width, max(1, y + shelf_height)), pygame.SRCALPHA)
+        entries = []
+        for index, (source, image, bounds) in enumerate(trimmed):
+            x, y = placements[index]
+            # Additive blit onto the empty sheet copies RGBA exactly (no blending)
+            sheet.blit(image, (x, y), bounds, special_flags=pygame.BLEND_RGBA_ADD)
+            entries.append((source, (x, y, bounds.width, bounds.height),
+                            bounds.topleft, image.get_size()))
+        return sheet, entries
+
+    def _write(self, sheet, entries):
+        # Write both files under temporary names first so a crash never leaves them half written.
+        os.makedirs(os.path.dirname(self.sheet_path), exist_ok=True)
+        sheet_temp_path = os.path.splitext(self.sheet_path)[0] + '.tmp.png'
+        index_temp_path = f'{self.index_path}.tmp'
+        pygame.image.save(sheet, sheet_temp_path)
+        with open(index_temp_path, 'w') as index_file:
+            for (folder, name, mtime), sheet_rect, offset, size in entries:
+                index_file.write('\t'.join((folder, name, str(mtime), ' '.join(map(str, sheet_rect)),
+                                            ' '.join(map(str, offset)), ' '.join(map(str, size)))) + '\n')
+        os.replace(sheet_temp_path, self.sheet_path)
+        os.replace(index_temp_path, self.index_path)
+
+    def build(self):
+        # Pack the category and save it; returns (sheet, entries).
+        sheet, entries = self._pack(self._sources())
+        try:
+            self._write(sheet, entries)
+        except (OSError, pygame.error):
+            pass  # Read-only install: use the sheet packed in memory
+        return sheet, entries
+
+    def load(self):
+        # Decode the sheet (building it if stale) and split it into folders.
+        entries = self._read_index(self._sources())
+        if entries is None:
+            sheet, entries = self.build()
+            self.sheet = sheet.convert_alpha()
+        else:
+            self.sheet = load_image(self.sheet_path)
+
+        self.folders = {}
+        for (folder, _, _), sheet_rect, offset, size in entries:
+            frames = self.folders.setdefault(folder, FrameList())
+            frames.append(self.sheet.subsurface(sheet_rect))
+            frames.offsets.append(offset)
+            frames.sizes.append(size)
+
+    def frames(self, folder):
+        # FrameList for a folder under the category root.
+        if self.sheet is None:
+            self.load()
+        return self.folders.get(os.path.normpath(folder), FrameList())
+
+
+_atlases = {category: TextureAtlas(category, root) for category, root in ATLAS_CATEGORIES.items()}
+
+
+def load_atlas(category):
+    # Decode (or build) a category's sheet ahead of its first atlas_frames().
+    atlas = _atlases[category]
+    if atlas.sheet is None:
+        atlas.load()
+
+
+def atlas_sheet_path(category):
+    return _atlases[category].sheet_path
+
+
+def atlas_frames(path):
+    # Frames of a folder from its category atlas, or None if no atlas covers it.
+    folder = os.path.normpath(path)
+    for atlas in _atlases.values():
+        if folder == atlas.root or folder.startswith(atlas.root + os.sep):
+            return atlas.frames(folder)
+    return None
+
+
+if __name__ == '__main__':
+    pygame.init()
+    pygame.display.set_mode((1, 1), pygame.HIDDEN)
+    for atlas in _atlases.values():
+        sheet, entries = atlas.build()
+        print(f'{atlas.category}: {len(entries)} frames -> {sheet.get_width()}x{sheet.get_height()} {atlas.sheet_path}')
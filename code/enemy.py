@@ -3,7 +3,7 @@ from settings import *
 from entity import Entity
 from support import *
 from astar import astar
-import math
+from asset_registry import AssetRegistry
 
 class Enemy(Entity):
     
@@ -14,8 +14,8 @@ class Enemy(Entity):
         # Load and initialize animations
         self.import_graphics(monster_name)
         self.status = 'idle'
-        self.image = self.animations[self.status][self.frame_index]
-        self.rect = self.image.get_rect(topleft = pos)
+        frames = self.animations[self.status]
+        self.set_frame(frames[self.frame_index], frames, self.frame_index, topleft = pos)
         
         # Collision detection
         self.hitbox = self.rect.inflate(0,-10)
@@ -36,11 +36,20 @@ class Enemy(Entity):
         
         # Finite state machine state
         self.state = 'idle'
+        self.player_distance = 0
+        self.player_direction = pygame.math.Vector2()
+        
+        # Slot in the Level's EnemySystem arrays (None when unmanaged)
+        self.system_index = None
+        
+        # Owning EnemyPool (None when created directly)
+        self.pool = None
         
         # Combat timers
         self.can_attack = True
         self.attack_time = None
         self.attack_cooldown_time = 400
+        self.attack_timer = None
         self.damage_player = damage_player
         self.trigger_death_particles = trigger_death_particles
         self.add_exp = add_exp
@@ -49,14 +58,12 @@ class Enemy(Entity):
         self.vulnerable = True
         self.hit_time = None
         self.invincibility_duration = 300
+        self.vulnerability_timer = None
         
-        # Audio
-        self.death_sound = pygame.mixer.Sound('audio/death.wav')
-        self.hit_sound = pygame.mixer.Sound('audio/hit.wav')
-        self.attack_sound = pygame.mixer.Sound(monster_info['attack_sound'])
-        self.death_sound.set_volume(0.6)
-        self.hit_sound.set_volume(0.6)
-        self.attack_sound.set_volume(0.3)
+        # Audio (shared between all enemies through the asset registry)
+        self.death_sound = AssetRegistry.sound('audio/death.wav', 0.6)
+        self.hit_sound = AssetRegistry.sound('audio/hit.wav', 0.6)
+        self.attack_sound = AssetRegistry.sound(monster_info['attack_sound'], 0.3)
                 
         # Store the pathfinding grid
         self.pathfinding_grid = pathfinding_grid
@@ -69,13 +76,38 @@ class Enemy(Entity):
         self.knockback_velocity = pygame.math.Vector2()
         self.knockback_decay = 0.82
     
-    def import_graphics(self, name):
-        # Load all animation frames for the specified monster type.
-        self.animations = {'idle': [], 'move': [], 'attack': []}
-        main_path = f'graphics/monsters/{name}/'
+    def reset(self, pos):
+        # Restore spawn state so a pooled enemy can be reused without reloading assets.
+        if self.level is not None:
+            self.level.timers.cancel(self.attack_timer)
+            self.level.timers.cancel(self.vulnerability_timer)
+        self.attack_timer = None
+        self.vulnerability_timer = None
         
-        for animation in self.animations.keys():
-            self.animations[animation] = import_folder(main_path + animation)
+        self.frame_index = 0
+        self.status = 'idle'
+        frames = self.animations[self.status]
+        self.set_frame(frames[self.frame_index], frames, self.frame_index, topleft = pos)
+        self.hitbox = self.rect.inflate(0,-10)
+        self.direction.update(0, 0)
+        
+        self.health = self.max_health
+        self.state = 'idle'
+        self.player_distance = 0
+        self.player_direction = pygame.math.Vector2()
+        self.can_attack = True
+        self.attack_time = None
+        self.vulnerable = True
+        self.hit_time = None
+        
+        self.path = []
+        self.path_update_cooldown = 0
+        self.knockback_velocity.update(0, 0)
+    
+    def import_graphics(self, name):
+        # Fetch the animation frames for the specified monster type (shared, read-only).
+        self.animations = AssetRegistry.monster_animations(name)
+        self.flicker_animations = AssetRegistry.flicker_animations(f'monster:{name}', self.animations)
     
     def get_player_distance_direction(self, player):
         # Calculate distance and normalized direction vector to player.
@@ -98,7 +130,10 @@ class Enemy(Entity):
     
     def update_state(self, player):
         # Finite state machine evaluating enemy behavior.
-        distance, _ = self.get_player_distance_direction(player)
+        # EnemySystem runs the same transitions vectorized for managed enemies.
+        distance, direction = self.get_player_distance_direction(player)
+        self.player_distance = distance
+        self.player_direction = direction
         low_health = self.health <= self.max_health * 0.3
 
         previous_state = self.state
@@ -122,11 +157,11 @@ class Enemy(Entity):
             self.status = 'idle'
     
     def actions(self, player):
-        # Execute behavior based on current status.
-        distance = self.get_player_distance_direction(player)[0]
+        # Execute behavior based on current status (uses the offsets from the last FSM pass).
+        distance = self.player_distance
         
         if self.state == 'attack':
-            self.attack_time = pygame.time.get_ticks()
+            self.attack_time = self.level.sim_time
             self.damage_player(self.attack_damage, self.attack_type, self.rect.center)
             self.attack_sound.play()
             self.path = []
@@ -181,18 +216,18 @@ class Enemy(Entity):
                 if direction.magnitude() < 10:
                     self.path.pop(0)
                     if len(self.path) == 0:
-                        self.direction = self.get_player_distance_direction(player)[1]
+                        self.direction = self.player_direction
                 else:
                     if direction.magnitude() > 0:
                         self.direction = direction.normalize()
             else:
                 # Fallback to direct movement
-                self.direction = self.get_player_distance_direction(player)[1]
+                self.direction = self.player_direction
         
         elif self.state == 'flee':
             self.path = []
             if distance > 0:
-                self.direction = (pygame.math.Vector2(self.rect.center) - pygame.math.Vector2(player.rect.center)).normalize()
+                self.direction = -self.player_direction
             else:
                 self.direction = pygame.math.Vector2(0, 0)
 
@@ -206,30 +241,26 @@ class Enemy(Entity):
         self.frame_index += self.animation_speed
 
         if self.frame_index >= len(self.animations[self.status]):
-            if self.status == 'attack':
+            if self.status == 'attack' and self.can_attack:
                 self.can_attack = False
+                remaining = self.attack_time + self.attack_cooldown_time - self.level.sim_time
+                self.attack_timer = self.set_timer(max(0, remaining), self._enable_attack)
             self.frame_index = 0
             
-        self.image = animation[int(self.frame_index)]
-        self.rect = self.image.get_rect(center = self.hitbox.center)
-        
-        if not self.vulnerable:
-            alpha = self.wave_value()
-            self.image.set_alpha(alpha)
-        else:
-            self.image.set_alpha(255)
-        
-    def cooldown(self):
-        # Manage attack and invulnerability cooldown timers.
-        current_time = pygame.time.get_ticks()
-        
-        if not self.can_attack:
-            if current_time - self.attack_time >= self.attack_cooldown_time:
-                self.can_attack = True
+        # Flicker effect during invulnerability (swap to the pre-baked frame)
+        frames = animation
+        if not self.vulnerable and self.wave_value() != 255:
+            animation = self.flicker_animations[self.status]
+            
+        frame = int(self.frame_index)
+        self.set_frame(animation[frame], frames, frame, center = self.hitbox.center)
         
-        if not self.vulnerable:
-            if current_time - self.hit_time >= self.invincibility_duration:
-                self.vulnerable = True
+    # Cooldown expirations, fired by the level's timer service
+    def _enable_attack(self):
+        self.can_attack = True
+
+    def _restore_vulnerability(self):
+        self.vulnerable = True
     
     def get_damge(self, player, attack_type):
         # Apply damage to enemy if not currently invulnerable.
@@ -249,8 +280,9 @@ class Enemy(Entity):
                 strength = 12 / max(1, self.resitance)
                 self.knockback_velocity = knockback_dir * strength
 
-            self.hit_time = pygame.time.get_ticks()
+            self.hit_time = self.level.sim_time
             self.vulnerable = False
+            self.vulnerability_timer = self.set_timer(self.invincibility_duration, self._restore_vulnerability)
 
     def check_death(self):
         # Remove enemy and trigger effects if health depleted.
@@ -259,6 +291,8 @@ class Enemy(Entity):
             self.trigger_death_particles(self.rect.center, self.monster_name)
             self.add_exp(self.exp)
             self.death_sound.play()
+            if self.pool is not None:
+                self.pool.release(self)
 
     def hit_reaction(self):
         # Apply decaying knockback impulse when recently hit.
@@ -299,89 +333,49 @@ class Enemy(Entity):
         """
         Move entity with collision detection using Spatial Hash Grid.
         
-        OPTIMIZATION: Instead of checking ALL obstacles, we only check
-        nearby obstacles using the spatial hash grid.
+        OPTIMIZATION: One spatial-grid query per move, and wall avoidance
+        through the level's precomputed ObstacleField instead of probing
+        rotated directions.
         
         Algorithm:
-        1. Normalize direction
-        2. Calculate predicted position
-        3. Query spatial grid for nearby obstacles (O(1) average)
-        4. Check collision only with nearby obstacles
-        5. If collision, try angled adjustments
-        6. Update position
+        1. Skip entirely when not moving (idle enemies cost nothing)
+        2. Query the spatial grid once for the area reachable this frame
+        3. If the predicted hitbox collides, look up the wall normal and
+           slide along the wall (single table lookup, no trig)
+        4. Apply per-axis movement, resolving collisions against the
+           obstacles from step 2
         
-        Performance: O(1) average case vs O(n) without spatial hash
+        Performance: O(1) average case, constant work per blocked enemy
         """
-        if self.direction.magnitude() != 0:
-            self.direction = self.direction.normalize()
+        if self.direction.x == 0 and self.direction.y == 0:
+            return
+        self.direction = self.direction.normalize()
 
-        # Calculate predicted hitbox position
-        predicted_hitbox = self.hitbox.copy()
-        predicted_hitbox.x += self.direction.x * speed
-        predicted_hitbox.y += self.direction.y * speed
+        # Obstacles reachable this frame in any direction
+        reach = int(speed) * 2 + 2
+        nearby_obstacles = self.level.spatial_grid.query(self.hitbox.inflate(reach, reach))
         
-        # === OPTIMIZATION: Use spatial hash grid ===
-        nearby_obstacles = self.level.spatial_grid.query(predicted_hitbox)
-        
-        # Check collision with nearby obstacles only
-        collision = False
+        # Check the predicted position against nearby obstacles only
+        predicted_hitbox = self.hitbox.move(self.direction.x * speed, self.direction.y * speed)
         for sprite in nearby_obstacles:
             if sprite.hitbox.colliderect(predicted_hitbox):
-                collision = True
+                # Collision ahead - slide along the wall if the field knows its normal
+                slide = self.level.obstacle_field.slide_direction(self.hitbox.center, self.direction)
+                if slide is not None:
+                    self.direction = slide
                 break
         
-        if not collision:
-            # No collision - move normally
-            self.hitbox.x += self.direction.x * speed
-            self.collision('horizontal')
-            self.hitbox.y += self.direction.y * speed
-            self.collision('vertical')
-            self.rect.center = self.hitbox.center
-        else:
-            # Collision detected - try angled adjustments
-            adjusted = False
-            for angle in [30, -30, 60, -60]:
-                rad_angle = math.radians(angle)
-                new_direction = pygame.math.Vector2(
-                    self.direction.x * math.cos(rad_angle) - self.direction.y * math.sin(rad_angle),
-                    self.direction.x * math.sin(rad_angle) + self.direction.y * math.cos(rad_angle)
-                )
-                
-                adjusted_hitbox = self.hitbox.copy()
-                adjusted_hitbox.x += new_direction.x * speed
-                adjusted_hitbox.y += new_direction.y * speed
-                
-                # Query spatial grid for adjusted position
-                nearby_for_adjusted = self.level.spatial_grid.query(adjusted_hitbox)
-                
-                collision_adjusted = False
-                for sprite in nearby_for_adjusted:
-                    if sprite.hitbox.colliderect(adjusted_hitbox):
-                        collision_adjusted = True
-                        break
-                
-                if not collision_adjusted:
-                    self.direction = new_direction
-                    self.hitbox.x += self.direction.x * speed
-                    self.hitbox.y += self.direction.y * speed
-                    self.rect.center = self.hitbox.center
-                    adjusted = True
-                    break
-            
-            if not adjusted:
-                # Couldn't find angle - move with standard collision
-                self.hitbox.x += self.direction.x * speed
-                self.collision('horizontal')
-                self.hitbox.y += self.direction.y * speed
-                self.collision('vertical')
-                self.rect.center = self.hitbox.center
+        self.hitbox.x += self.direction.x * speed
+        self.collision('horizontal', nearby_obstacles)
+        self.hitbox.y += self.direction.y * speed
+        self.collision('vertical', nearby_obstacles)
+        self.rect.center = self.hitbox.center
     
     def update(self):
         # Update enemy state each frame.
         knockback_active = self.hit_reaction()
         if not knockback_active:
             self.move(self.speed)
-        self.cooldown()
         self.animate()
         self.check_death()
     
@@ -0,0 +1,104 @@
+"""
+Enemy Pool - Reusable Enemy instances per monster type
+
+Purpose: Spawning and killing many enemies (arena waves) without constructing
+new Enemy objects, re-fetching assets or triggering allocation spikes.
+
+Lifecycle:
+- prewarm():  build idle instances ahead of time (outside every sprite group)
+- acquire():  pop a free instance, reset() it at the spawn position and add it
+              to the requested groups
+- release():  called by Enemy.check_death; the instance returns to its free list
+
+Metrics (get_stats) report per-type active/free/created counts and peaks so
+pool sizes can be tuned.
+"""
+
+
+class EnemyPool:
+
+    def __init__(self, factory, on_spawn=None, on_release=None):
+        """
+        Args:
+            factory: callable(monster_name) -> new Enemy not in any group
+            on_spawn: optional callable(enemy) run after every acquire
+                      (e.g. register with the LOD scheduler and EnemySystem)
+            on_release: optional callable(enemy) run when an enemy returns to the pool
+        """
+        self.factory = factory
+        self.on_spawn = on_spawn
+        self.on_release = on_release
+
+        self._free = {}      # monster_name -> [idle enemies]
+        self._active = set()
+        self.stats = {}      # monster_name -> {'active', 'free', 'created', 'peak_active', 'spawned'}
+
+    def _type_stats(self, monster_name):
+        stats = self.stats.get(monster_name)
+        if stats is None:
+            stats = {'active': 0, 'free': 0, 'created': 0, 'peak_active': 0, 'spawned': 0}
+            self.stats[monster_name] = stats
+            self._free[monster_name] = []
+        return stats
+
+    def _create(self, monster_name):
+        enemy = self.factory(monster_name)
+        enemy.pool = self
+        self._type_stats(monster_name)['created'] += 1
+        return enemy
+
+    def prewarm(self, monster_name, count):
+        # Build idle instances until the free list holds at least count enemies.
+        stats = self._type_stats(monster_name)
+        free = self._free[monster_name]
+        while len(free) < count:
+            free.append(self._create(monster_name))
+        stats['free'] = len(free)
+
+    def acquire(self, monster_name, pos, groups):
+        # Spawn an enemy at pos, reusing a free instance when available.
+        stats = self._type_stats(monster_name)
+        free = self._free[monster_name]
+        enemy = free.pop() if free else self._create(monster_name)
+
+        enemy.reset(pos)
+        enemy.add(*groups)
+        self._active.add(enemy)
+
+        stats['free'] = len(free)
+        stats['active'] += 1
+        stats['spawned'] += 1
+        if stats['active'] > stats['peak_active']:
+            stats['peak_active'] = stats['active']
+
+        if self.on_spawn:
+            self.on_spawn(enemy)
+        return enemy
+
+    def release(self, enemy):
+        # Return a dead or despawned enemy to its free list.
+        if enemy not in self._active:
+            return
+        self._active.discard(enemy)
+        enemy.kill()
+        if self.on_release:
+            self.on_release(enemy)
+
+        stats = self.stats[enemy.monster_name]
+        free = self._free[enemy.monster_name]
+        free.append(enemy)
+        stats['free'] = len(free)
+        stats['active'] -= 1
+
+    def active_count(self):
+        return len(self._active)
+
+    def get_stats(self):
+        # Per-type occupancy plus totals.
+        stats = {name: values.copy() for name, values in self.stats.items()}
+        stats['total'] = {
+            'active': len(self._active),
+            'free': sum(len(free) for free in self._free.values()),
+            'created': sum(values['created'] for values in self.stats.values())
+        }
+        return stats
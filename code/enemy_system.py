@@ -0,0 +1,186 @@
+"""
+Enemy System - Structure-of-Arrays AI Evaluation
+
+Purpose: Replace per-enemy Python FSM evaluation (several Vector2 allocations
+and distance computations per enemy per frame) with one vectorized pass.
+
+Data layout: every registered enemy owns a slot index into flat NumPy arrays
+- positions (x, y), health / max health, attack and notice radii
+- can_attack flags (re-enabled by the level's timer service)
+- the FSM state code from the previous frame
+
+Per frame:
+1. Gather the moving data (center, health, can_attack) of simulated enemies
+2. Evaluate attack / flee / pursue / idle for all of them at once
+3. Write back only what the sprites need: changed states and the player
+   distance/direction for enemies that are not idle
+4. Run Enemy.actions for those enemies; idle enemies cost nothing more
+
+When a proximity set is passed, only those enemies are evaluated; every other
+simulated enemy short-circuits to idle without any distance math.
+"""
+
+import numpy as np
+import pygame
+
+# FSM state codes (index into STATE_NAMES)
+IDLE, PURSUE, FLEE, ATTACK = 0, 1, 2, 3
+STATE_NAMES = ('idle', 'pursue', 'flee', 'attack')
+STATE_STATUS = ('idle', 'move', 'move', 'attack')
+
+
+class EnemySystem:
+
+    def __init__(self, capacity=128):
+        self.capacity = 0
+        self.enemies = []
+        self._free_slots = []
+
+        self.positions = np.zeros((0, 2), dtype=np.float64)
+        self.health = np.zeros(0, dtype=np.float64)
+        self.max_health = np.zeros(0, dtype=np.float64)
+        self.attack_radius = np.zeros(0, dtype=np.float64)
+        self.notice_radius = np.zeros(0, dtype=np.float64)
+        self.can_attack = np.zeros(0, dtype=bool)
+        self.state = np.zeros(0, dtype=np.int8)
+
+        self._allocate(capacity)
+
+    def _allocate(self, capacity):
+        # Grow every array to the requested capacity, keeping existing slots.
+        def grow(array, fill=0):
+            new_array = np.full((capacity,) + array.shape[1:], fill, dtype=array.dtype)
+            new_array[:len(array)] = array
+            return new_array
+
+        self.positions = grow(self.positions)
+        self.health = grow(self.health)
+        self.max_health = grow(self.max_health)
+        self.attack_radius = grow(self.attack_radius)
+        self.notice_radius = grow(self.notice_radius)
+        self.can_attack = grow(self.can_attack, True)
+        self.state = grow(self.state, IDLE)
+
+        self.enemies.extend([None] * (capacity - self.capacity))
+        self._free_slots.extend(range(capacity - 1, self.capacity - 1, -1))
+        self.capacity = capacity
+
+    def register(self, enemy):
+        # Assign the enemy a slot and copy its static stats into the arrays.
+        self.unregister(enemy)
+        if not self._free_slots:
+            self._allocate(max(1, self.capacity * 2))
+
+        slot = self._free_slots.pop()
+        self.enemies[slot] = enemy
+        enemy.system_index = slot
+
+        self.positions[slot] = enemy.rect.center
+        self.health[slot] = enemy.health
+        self.max_health[slot] = enemy.max_health
+        self.attack_radius[slot] = enemy.attack_radius
+        self.notice_radius[slot] = enemy.notice_radius
+        self.can_attack[slot] = enemy.can_attack
+        self.state[slot] = STATE_NAMES.index(enemy.state)
+        return slot
+
+    def unregister(self, enemy):
+        # Release the enemy's slot for reuse.
+        slot = getattr(enemy, 'system_index', None)
+        if slot is None or self.enemies[slot] is not enemy:
+            return
+        self.enemies[slot] = None
+        enemy.system_index = None
+        self._free_slots.append(slot)
+
+    def _force_idle(self, enemy, player):
+        # Short-circuit an enemy that is out of the player's reach back to idle.
+        self.state[enemy.system_index] = IDLE
+        enemy.state = STATE_NAMES[IDLE]
+        enemy.status = STATE_STATUS[IDLE]
+        enemy.actions(player)
+
+    def __len__(self):
+        return self.capacity - len(self._free_slots)
+
+    def update(self, player, enemies, nearby=None):
+        """
+        Evaluate the FSM for the given enemies and run their actions.
+
+        Args:
+            player: Player sprite (target of every enemy)
+            enemies: Iterable of enemies simulated this frame (e.g. from the LOD scheduler)
+            nearby: Optional set of enemies that may notice the player; the
+                    rest are forced idle without evaluating distances
+        """
+        active = []
+        for enemy in enemies:
+            if not enemy.alive():
+                self.unregister(enemy)
+            elif nearby is None or enemy in nearby:
+                active.append(enemy)
+            elif enemy.state != 'idle':
+                self._force_idle(enemy, player)
+        if not active:
+            return
+
+        # 1. Gather moving data (one pass, no Vector2 allocations)
+        slots = np.fromiter((enemy.system_index for enemy in active), dtype=np.intp, count=len(active))
+        gathered = np.array(
+            [(enemy.rect.centerx, enemy.rect.centery, enemy.health, enemy.can_attack) for enemy in active],
+            dtype=np.float64
+        )
+        self.positions[slots] = gathered[:, :2]
+        self.health[slots] = gathered[:, 2]
+        can_attack = gathered[:, 3].astype(bool)
+        self.can_attack[slots] = can_attack
+
+        # 2. Distances and FSM transitions for all enemies at once
+        offset = np.array(player.rect.center, dtype=np.float64) - self.positions[slots]
+        distance = np.hypot(offset[:, 0], offset[:, 1])
+        notice_radius = self.notice_radius[slots]
+        low_health = self.health[slots] <= self.max_health[slots] * 0.3
+
+        new_state = np.select(
+            [
+                (distance <= self.attack_radius[slots]) & can_attack,
+                low_health & (distance < notice_radius * 0.75),
+                distance <= notice_radius
+            ],
+            [ATTACK, FLEE, PURSUE],
+            default=IDLE
+        ).astype(np.int8)
+
+        changed = new_state != self.state[slots]
+        self.state[slots] = new_state
+
+        # 3. Write back: state changes, then player offsets for enemies that act
+        for index in np.flatnonzero(changed).tolist():
+            enemy = active[index]
+            code = int(new_state[index])
+            enemy.state = STATE_NAMES[code]
+            if code == ATTACK and enemy.status != 'attack':
+                enemy.frame_index = 0
+            enemy.status = STATE_STATUS[code]
+
+        # Idle enemies stand still; a hit may have given one a direction since its last action
+        for index in np.flatnonzero((new_state == IDLE) & ~changed).tolist():
+            enemy = active[index]
+            if enemy.direction.x or enemy.direction.y:
+                enemy.direction = pygame.math.Vector2(0, 0)
+
+        acting = np.flatnonzero((new_state != IDLE) | changed)
+        if len(acting) == 0:
+            return
+
+        safe_distance = np.where(distance > 0, distance, 1.0)
+        direction = offset / safe_distance[:, None]
+        direction[distance == 0] = 0
+
+        # 4. Actions only for enemies that are doing something
+        for index, dist, dx, dy in zip(acting.tolist(), distance[acting].tolist(),
+                                       direction[acting, 0].tolist(), direction[acting, 1].tolist()):
+            enemy = active[index]
+            enemy.player_distance = dist
+            enemy.player_direction = pygame.math.Vector2(dx, dy)
+            enemy.actions(player)
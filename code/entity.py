@@ -10,6 +10,15 @@ class Entity(pygame.sprite.Sprite):
         self.animation_speed = 0.15
         self.direction = pygame.math.Vector2()
         self.level = level
+        self.image_offset = (0, 0)  # Where the (atlas-trimmed) image sits inside rect
+     
+    def set_frame(self, image, frames, index, **position):
+        # Show image as frame index of frames; rect keeps the untrimmed frame size.
+        self.image = image
+        self.image_offset = frames.offsets[index]
+        self.rect = pygame.Rect((0, 0), frames.sizes[index])
+        for attribute, value in position.items():
+            setattr(self.rect, attribute, value)
      
     def move(self, speed):
         # Move entity with collision detection and normalization.
@@ -27,7 +36,7 @@ class Entity(pygame.sprite.Sprite):
         # Sync visual rect with hitbox position
         self.rect.center = self.hitbox.center
     
-    def collision(self, direction):
+    def collision(self, direction, obstacles=None):
         """
         Handle collision detection with spatial hash optimization.
         
@@ -38,9 +47,13 @@ class Entity(pygame.sprite.Sprite):
         4. Resolve collision by adjusting hitbox position
         
         This maintains backwards compatibility while optimizing when possible.
+        Callers that already queried the grid can pass the candidates in
+        `obstacles` to skip the second lookup.
         """
         # Determine which obstacles to check
-        if hasattr(self, 'level') and self.level and hasattr(self.level, 'spatial_grid'):
+        if obstacles is not None:
+            obstacles_to_check = obstacles
+        elif hasattr(self, 'level') and self.level and hasattr(self.level, 'spatial_grid'):
             # OPTIMIZED PATH: Use spatial hash grid
             obstacles_to_check = self.level.spatial_grid.query(self.hitbox)
         else:
@@ -64,9 +77,13 @@ class Entity(pygame.sprite.Sprite):
                     if self.direction.y > 0:  # Moving down
                         self.hitbox.bottom = sprite.hitbox.top
                         
+    def set_timer(self, delay, callback):
+        # Schedule a one-shot callback on the level's timer service (simulation time).
+        return self.level.timers.schedule(delay, callback, self.level.sim_time)
+    
     def wave_value(self):
         # Generate oscillating value for flicker effect (0 or 255).
-        value = sin(pygame.time.get_ticks())
+        value = sin(self.level.sim_time)
         
         if value >= 0:
             return 255
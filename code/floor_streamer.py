@@ -0,0 +1,206 @@
+"""
+Floor Streamer - Tiled, lazily loaded floor texture
+
+Purpose: Stop keeping the whole-map ground image in memory and blitting it
+every frame. The floor is split into FLOOR_TILE_SIZE tiles that are loaded
+around the camera and evicted least-recently-used under a memory budget.
+
+Algorithm:
+1. Tiles come from an on-disk tile set (CACHE_DIR/floor/...), cut from the
+   source image the first time it is used or whenever the source changes.
+   This is the only time the full image is decoded.
+2. Each frame, tiles overlapping the camera are loaded on demand and only
+   their visible subrectangles are blitted.
+3. Up to FLOOR_PREFETCH_PER_FRAME tiles in the direction the camera moves
+   are loaded ahead of time so streaming doesn't stall when they come into view.
+4. Tiles not used this frame are evicted (oldest first) while the cache
+   exceeds FLOOR_MEMORY_BUDGET bytes.
+
+A missing tile file makes the tile set be cut again, at startup or when the
+tile is loaded. If the tile set cannot be written, the full image stays
+loaded and tiles are served as subsurfaces of it.
+"""
+
+import os
+from collections import OrderedDict
+import pygame
+from settings import CACHE_DIR, FLOOR_TILE_SIZE, FLOOR_MEMORY_BUDGET, FLOOR_PREFETCH_PER_FRAME
+
+
+class FloorStreamer:
+
+    def __init__(self, path, tile_size=FLOOR_TILE_SIZE, memory_budget=FLOOR_MEMORY_BUDGET):
+        self.path = path
+        self.tile_size = tile_size
+        self.memory_budget = memory_budget
+
+        self._tiles = OrderedDict()  # (col, row) -> Surface, least recently used first
+        self._tile_bytes = {}
+        self.memory_used = 0
+        self._last_offset = None
+        self._source = None  # Full image, only kept when the tile set can't be written
+
+        self.stats = {'loads': 0, 'evictions': 0, 'prefetched': 0}
+
+        name = os.path.splitext(os.path.basename(path))[0]
+        self.tile_dir = os.path.join(CACHE_DIR, 'floor', f'{name}_{tile_size}')
+        self.width, self.height = self._prepare_tiles()
+        self.cols = -(-self.width // tile_size)
+        self.rows = -(-self.height // tile_size)
+
+    def _prepare_tiles(self):
+        # Make sure an up-to-date tile set exists; returns the map size in pixels.
+        source_mtime = int(os.path.getmtime(self.path))
+        try:
+            with open(self._index_path()) as index_file:
+                mtime, width, height = (int(value) for value in index_file.read().split())
+            if mtime == source_mtime and self._tiles_exist(width, height):
+                return width, height
+        except (OSError, ValueError):
+            pass
+
+        source = pygame.image.load(self.path)
+        if not self._cut_tiles(source, source_mtime):
+            # Read-only install: serve tiles from the decoded image instead
+            self._source = source.convert()
+        return source.get_size()
+
+    def _index_path(self):
+        return os.path.join(self.tile_dir, 'index.txt')
+
+    def _tiles_exist(self, width, height):
+        return all(os.path.exists(self._tile_path(col, row))
+                   for row in range(-(-height // self.tile_size))
+                   for col in range(-(-width // self.tile_size)))
+
+    def _cut_tiles(self, source, source_mtime):
+        # Write the tile set and its index; False if they can't be written.
+        width, height = source.get_size()
+        try:
+            os.makedirs(self.tile_dir, exist_ok=True)
+            for row in range(-(-height // self.tile_size)):
+                for col in range(-(-width // self.tile_size)):
+                    area = pygame.Rect(col * self.tile_size, row * self.tile_size,
+                                       self.tile_size, self.tile_size).clip(source.get_rect())
+                    pygame.image.save(source.subsurface(area), self._tile_path(col, row))
+            with open(self._index_path(), 'w') as index_file:
+                index_file.write(f'{source_mtime} {width} {height}')
+        except (OSError, pygame.error):
+            return False
+        return True
+
+    def _tile_path(self, col, row):
+        return os.path.join(self.tile_dir, f'{col}_{row}.bmp')
+
+    def _tile_rect(self, col, row):
+        return pygame.Rect(col * self.tile_size, row * self.tile_size,
+                           self.tile_size, self.tile_size).clip((0, 0, self.width, self.height))
+
+    def _load(self, key):
+        # Return a cached tile, loading it from disk if needed.
+        tile = self._tiles.get(key)
+        if tile is not None:
+            self._tiles.move_to_end(key)
+            return tile
+
+        if self._source is None:
+            try:
+                tile = pygame.image.load(self._tile_path(*key)).convert()
+            except (OSError, pygame.error):
+                tile = self._recover(key)
+        else:
+            tile = self._source.subsurface(self._tile_rect(*key))
+        self._tiles[key] = tile
+        self._tile_bytes[key] = tile.get_width() * tile.get_height() * tile.get_bytesize()
+        self.memory_used += self._tile_bytes[key]
+        self.stats['loads'] += 1
+        return tile
+
+    def _recover(self, key):
+        # A tile went missing or got damaged after startup: cut the set again from the source.
+        source = pygame.image.load(self.path)
+        if self._cut_tiles(source, int(os.path.getmtime(self.path))):
+            try:
+                return pygame.image.load(self._tile_path(*key)).convert()
+            except (OSError, pygame.error):
+                pass
+        self._source = source.convert()
+        return self._source.subsurface(self._tile_rect(*key))
+
+    def _evict(self, keep):
+        # Drop least recently used tiles until the cache fits the budget.
+        for key in list(self._tiles):
+            if self.memory_used <= self.memory_budget:
+                break
+            if key in keep:
+                continue
+            del self._tiles[key]
+            self.memory_used -= self._tile_bytes.pop(key)
+            self.stats['evictions'] += 1
+
+    def _tile_range(self, rect):
+        first_col = max(0, rect.left // self.tile_size)
+        last_col = min(self.cols - 1, (rect.right - 1) // self.tile_size)
+        first_row = max(0, rect.top // self.tile_size)
+        last_row = min(self.rows - 1, (rect.bottom - 1) // self.tile_size)
+        return [(col, row) for row in range(first_row, last_row + 1)
+                for col in range(first_col, last_col + 1)]
+
+    def _prefetch(self, camera_rect, offset):
+        # Load tiles ahead of the camera's movement direction.
+        if self._last_offset is None:
+            return
+        move_x = offset.x - self._last_offset[0]
+        move_y = offset.y - self._last_offset[1]
+        if not move_x and not move_y:
+            return
+
+        ahead = camera_rect.move((self.tile_size if move_x > 0 else -self.tile_size if move_x < 0 else 0),
+                                 (self.tile_size if move_y > 0 else -self.tile_size if move_y < 0 else 0))
+        budget = FLOOR_PREFETCH_PER_FRAME
+        for key in self._tile_range(ahead):
+            if budget == 0:
+                break
+            if key not in self._tiles:
+                self._load(key)
+                self.stats['prefetched'] += 1
+                budget -= 1
+
+    def draw(self, surface, offset):
+        """
+        Blit the visible parts of the floor.
+
+        Args:
+            surface: Target surface (the camera view)
+            offset: Camera offset in world pixels (Vector2)
+        """
+        surface_width, surface_height = surface.get_size()
+        camera_rect = pygame.Rect(-int(-offset.x), -int(-offset.y), surface_width, surface_height)
+
+        # Same float -> int conversion blit() applies to the whole-map floor position
+        origin_x = int(-offset.x)
+        origin_y = int(-offset.y)
+
+        visible = self._tile_range(camera_rect)
+        for col, row in visible:
+            tile = self._load((col, row))
+            dest_x = origin_x + col * self.tile_size
+            dest_y = origin_y + row * self.tile_size
+
+            # Only the part of the tile that lands on the surface
+            left = max(0, -dest_x)
+            top = max(0, -dest_y)
+            right = min(tile.get_width(), surface_width - dest_x)
+            bottom = min(tile.get_height(), surface_height - dest_y)
+            if right > left and bottom > top:
+                surface.blit(tile, (dest_x + left, dest_y + top), (left, top, right - left, bottom - top))
+
+        self._prefetch(camera_rect, offset)
+        self._last_offset = (offset.x, offset.y)
+        self._evict(set(visible))
+
+    def get_stats(self):
+        stats = self.stats.copy()
+        stats['cached_tiles'] = len(self._tiles)
+        stats['memory_used'] = self.memory_used
+        return stats
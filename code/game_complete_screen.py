@@ -8,10 +8,19 @@ class GameCompleteScreen:
         self.font = pygame.font.Font(UI_FONT, UI_FONT_SIZE)
         self.big_font = pygame.font.Font(UI_FONT, UI_FONT_SIZE * 2)
 
+        self.layout_size = None
         self._update_layout()
 
     def _update_layout(self):
         width, height = self.display_surface.get_size()
+        if self.layout_size == (width, height):
+            return
+        self.layout_size = (width, height)
+
+        self.overlay = pygame.Surface((width, height))
+        self.overlay.set_alpha(200)
+        self.overlay.fill((0, 0, 0))
+
         self.title_surf = self.big_font.render('Congratulations!', True, TEXT_COLOR)
         self.title_rect = self.title_surf.get_rect(center=(width // 2, height // 2 - 80))
 
@@ -27,10 +36,7 @@ class GameCompleteScreen:
         # Ensure layout matches current screen size (in case of resize)
         self._update_layout()
 
-        overlay = pygame.Surface(self.display_surface.get_size())
-        overlay.set_alpha(200)
-        overlay.fill((0, 0, 0))
-        self.display_surface.blit(overlay, (0, 0))
+        self.display_surface.blit(self.overlay, (0, 0))
 
         self.display_surface.blit(self.title_surf, self.title_rect)
         self.display_surface.blit(self.subtitle_surf, self.subtitle_rect)
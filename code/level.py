@@ -1,44 +1,173 @@
+import os
 import sys
+import heapq
 import pygame
-from settings import TILESIZE, DEBUG_MODE
+from time import perf_counter
+from settings import (TILESIZE, DEBUG_MODE, ARENA_MODE, SIMULATION_STEP_MS, MAX_CATCH_UP_STEPS,
+                      RENDER_RESOLUTION, RENDER_SMOOTH_SCALE, RENDER_UI_NATIVE, ATLAS_CATEGORIES,
+                      ASSET_LOADER_FRAME_BUDGET_MS, WATER_COLOR,
+                      weapon_data, magic_data, monster_data)
 from tile import Tile
 from player import Player
-from support import import_csv_layout, import_folder
+from entity import Entity
+from support import import_csv_layout, import_folder, blit_batch
 from random import choice, randint
 from weapon import Weapon
 from ui import UI
 from death_screen import DeathScreen
 from game_complete_screen import GameCompleteScreen
 from enemy import Enemy
-from particles import AnimationPlayer
+from particles import AnimationPlayer, ParticleSystem
 from magic import MagicPlayer
+from projectiles import ProjectileSystem
 from upgrade import Upgrade
 from spatial_hash import SpatialHashGrid
+from static_layer import StaticChunkLayer
+from floor_streamer import FloorStreamer
+from lod_scheduler import LODScheduler
+from enemy_system import EnemySystem
+from timers import TimerService
+from steering import ObstacleField
+from enemy_pool import EnemyPool
+from wave_spawner import WaveSpawner
+from asset_registry import AssetRegistry
+from asset_loader import AssetLoader
+
+
+def level_manifest():
+    # Every file Level() reads, as AssetLoader (kind, path) items.
+    manifest = [('csv', f'map/map_{name}.csv') for name in ('FloorBlocks', 'Grass', 'Objects', 'Entities')]
+    for folder in ('graphics/Grass', 'graphics/Objects'):
+        for path, _, files in os.walk(folder):
+            manifest += [('image', path + '/' + name) for name in files]
+    manifest += [('atlas', category) for category in ATLAS_CATEGORIES]
+
+    for name, data in weapon_data.items():
+        manifest += [('image', f'graphics/weapons/{name}/{direction}.png')
+                     for direction in AssetRegistry.WEAPON_DIRECTIONS]
+        manifest.append(('image', data['graphic']))
+    manifest += [('image', data['graphic']) for data in magic_data.values()]
+    manifest += [('image', 'graphics/player/down_idle/idle_down.png'),
+                 ('image', 'graphics/player/faceset/faceset.png')]
+
+    sounds = ['audio/death.wav', 'audio/hit.wav', 'audio/heal.wav', 'audio/Fire.wav', 'audio/sword.wav']
+    sounds += [data['attack_sound'] for data in monster_data.values()]
+    manifest += [('sound', path) for path in dict.fromkeys(sounds)]
+    return manifest
+
+
+class LevelBuilder:
+    # Builds the next Level a slice at a time: its assets on an AssetLoader, then Level.build() stages.
+
+    def __init__(self, input_manager=None, game=None):
+        self.input_manager = input_manager
+        self.game = game
+        self.loader = AssetLoader(level_manifest())
+        self.level = None  # Set once every stage has run
+        self.stages_done = 0  # Level construction stages run so far
+        self.stages_total = 1 + Level.BUILD_STAGES  # Deferred Level() plus the build() stages
+        self._steps = self._build()
+
+    def _build(self):
+        self.loader.start()
+        while not self.loader.done:
+            self.loader.update()
+            yield
+
+        level = Level(self.input_manager, self.game, deferred=True)
+        self.stages_done += 1
+        yield
+        for _ in level.build():
+            self.stages_done += 1
+            yield
+        self.level = level
+
+    def update(self, budget_ms=ASSET_LOADER_FRAME_BUDGET_MS):
+        # Run build stages until the time budget is spent or the level is ready.
+        deadline = perf_counter() + budget_ms / 1000
+        while self.level is None:
+            next(self._steps, None)
+            if not self.loader.done or perf_counter() >= deadline:
+                break  # Loader stages bring their own budget
+
+    @property
+    def progress(self):
+        # Loaded assets and construction stages, one unit each.
+        if self.level is not None:
+            return 1.0
+        return (self.loader.completed + self.stages_done) / (self.loader.total + self.stages_total)
+
+    @property
+    def done(self):
+        return self.level is not None
+
+    def cancel(self):
+        # Stop the loader's worker threads (the game is quitting).
+        self.loader.shutdown()
 
 
 class Level():
     
-    def __init__(self, input_manager=None, game=None):
+    BUILD_STAGES = 6  # Stages build() yields after (LevelBuilder progress)
+    
+    def __init__(self, input_manager=None, game=None, deferred=False):
+        """
+        Args:
+            input_manager: Shared InputManager
+            game: Owning Game instance
+            deferred: Leave the map, UI and effects to build() and arena start
+                to activate() (see LevelBuilder); otherwise both run here
+        """
         self.display_surface = pygame.display.get_surface()
+        self.world_surface = self._create_world_surface()
         self.game_paused = False 
+        self.paused_snapshot = None  # World frame captured when the upgrade menu opened
+        self.accumulator = 0  # Banked milliseconds not yet simulated
         self.input_manager = input_manager
         self.game = game  # Store reference to Game instance
         
         # Sprite groups for rendering and collision detection
-        self.visible_sprites = YSortCameraGroup()
+        self.visible_sprites = YSortCameraGroup(self.world_surface)
         self.obstacle_sprites = pygame.sprite.Group()       
         
         # Combat-related sprite groups
         self.current_attack = None
         self.attack_sprites = pygame.sprite.Group()
+        self.free_weapons = []  # Weapon sprites kept for reuse by create_attack
         self.attackable_sprites = pygame.sprite.Group()
         
+        # Central timer service for cooldowns and invulnerability windows, on the simulation clock
+        self.timers = TimerService()
+        self.sim_time = 0  # Simulated milliseconds (SIMULATION_STEP_MS per step; stops while paused or behind)
+        
         # Spatial Hash Grid for optimized collision detection
         self.spatial_grid = SpatialHashGrid(cell_size=TILESIZE * 3)
         
-        self.create_map()
+        # Level-of-detail scheduler deciding which enemies simulate each frame
+        self.lod_scheduler = LODScheduler(view_surface=self.world_surface)
+        
+        # Vectorized enemy AI (FSM evaluation for all simulated enemies at once)
+        self.enemy_system = EnemySystem()
+        
+        # Reusable enemy instances (map enemies and arena waves)
+        self.enemy_pool = EnemyPool(self._build_enemy, on_spawn=self._register_enemy,
+                                    on_release=self._unregister_enemy)
+        self.enemy_spawn_points = []
+        
+        if not deferred:
+            for _ in self.build():
+                pass
+            self.activate()
+
+    def build(self):
+        # Construct the map, UI and effect systems, yielding between stages.
+        # Every weapon graphic is decoded once, before the first swing
+        AssetRegistry.preload_weapons()
+        yield
+        
+        yield from self.create_map()
 
-        self.ui = UI(self.input_manager)
+        self.ui = UI(self.input_manager, self.display_surface if RENDER_UI_NATIVE else self.world_surface)
         # Pass the game instance to the Upgrade menu
         self.upgrade = Upgrade(self.player, self.input_manager, game=self.game)
 
@@ -46,12 +175,21 @@ class Level():
         self.is_dead = False
         self.game_complete_screen = GameCompleteScreen(self.display_surface)
         self.game_complete = False
+        yield
 
-        self.animation_player = AnimationPlayer()
-        self.magic_player = MagicPlayer(self.animation_player)
+        self.particles = ParticleSystem(draw_sequence=self.visible_sprites.reserve_draw_sequence)
+        self.visible_sprites.particles = self.particles
+        self.animation_player = AnimationPlayer(self.particles)
+        self.projectiles = ProjectileSystem(self._attack_targets, self._hit_target)
+        self.magic_player = MagicPlayer(self.animation_player, self.projectiles)
         
-        # Pathfinding grid
-        self.pathfinding_grid = None
+        # Arena mode wave spawner (created on demand)
+        self.wave_spawner = None
+
+    def activate(self):
+        # Start what runs on the clock (arena waves) once the level is being played.
+        if ARENA_MODE:
+            self.start_arena()
         
     def get_state(self):
         # Return a dictionary representing the current level state.
@@ -69,6 +207,9 @@ class Level():
             
         if 'player_state' in state:
             self.player.load_state(state['player_state'])
+            # The player was moved outside a simulation step: re-hash it for culling and drop its stale interpolation origin
+            self.visible_sprites.dynamic_grid.move(self.player)
+            self.visible_sprites.previous_centers.pop(self.player, None)
             
         if 'game_complete' in state:
             self.game_complete = state['game_complete']
@@ -78,9 +219,10 @@ class Level():
             
         # Reset any necessary game state
         self.is_dead = False
+        self.paused_snapshot = None
     
     def create_map(self):
-        # Load CSV layouts and graphics, then instantiate all map tiles and entities.
+        # Load CSV layouts and graphics, then instantiate all map tiles and entities (a generator: yields after each layout).
         layouts = {
             'boundary': import_csv_layout('map/map_FloorBlocks.csv'),
             'grass': import_csv_layout('map/map_Grass.csv'),
@@ -138,38 +280,70 @@ class Level():
                                 else:
                                     monster_name = 'eye'
                                 
-                                enemy = Enemy(monster_name = monster_name, 
-                                        pos = (x,y), 
-                                        groups = [self.visible_sprites, self.attackable_sprites],
-                                        obstacle_sprites = self.obstacle_sprites,
-                                        damage_player = self.damage_player,
-                                        trigger_death_particles = self.trigger_death_particles,
-                                        add_exp = self.add_exp,
-                                        pathfinding_grid = self.pathfinding_grid)
-                                enemy.level = self  # Set level reference
+                                self.enemy_spawn_points.append((x, y))
+                                self.enemy_pool.acquire(monster_name, (x, y), [self.visible_sprites, self.attackable_sprites])
                         
                         # Mark obstacles in pathfinding grid
                         if style in ['boundary', 'object', 'grass']:
                             if 0 <= row_index < len(self.pathfinding_grid) and 0 <= col_index < len(self.pathfinding_grid[0]):
                                 self.pathfinding_grid[row_index][col_index] = False
+            yield
+        
+        # Precomputed wall normals used by enemy steering
+        self.obstacle_field = ObstacleField(self.pathfinding_grid)
         
+    def _build_enemy(self, monster_name):
+        # Factory for EnemyPool: a new enemy outside every group.
+        enemy = Enemy(monster_name = monster_name, 
+                pos = (0, 0), 
+                groups = [],
+                obstacle_sprites = self.obstacle_sprites,
+                damage_player = self.damage_player,
+                trigger_death_particles = self.trigger_death_particles,
+                add_exp = self.add_exp,
+                pathfinding_grid = self.pathfinding_grid)
+        enemy.level = self  # Set level reference
+        return enemy
+    
+    def _register_enemy(self, enemy):
+        # Hook every spawned enemy into the simulation systems.
+        self.lod_scheduler.register(enemy)
+        self.enemy_system.register(enemy)
+    
+    def _unregister_enemy(self, enemy):
+        self.lod_scheduler.unregister(enemy)
+        self.enemy_system.unregister(enemy)
+    
+    def start_arena(self):
+        # Switch to arena mode: endless enemy waves from the pre-warmed pools.
+        if self.wave_spawner is None:
+            self.wave_spawner = WaveSpawner(self, self.enemy_pool, self.enemy_spawn_points,
+                                            [self.visible_sprites, self.attackable_sprites])
+        self.wave_spawner.start()
+    
     def create_attack(self):
-        # Instantiate player's weapon sprite.
-        self.current_attack = Weapon(self.player, 
-                                     groups = [self.visible_sprites, self.attack_sprites])
+        # Show the player's weapon sprite, reusing a pooled one when available.
+        if self.free_weapons:
+            self.current_attack = self.free_weapons.pop()
+            self.current_attack.reset(self.player)
+            self.current_attack.add(self.visible_sprites, self.attack_sprites)
+        else:
+            self.current_attack = Weapon(self.player, 
+                                         groups = [self.visible_sprites, self.attack_sprites])
     
     def create_magic(self, style, strength, cost):
         # Execute magic attack based on style type.
         if style == 'heal':
-            self.magic_player.heal(self.player, strength, cost, [self.visible_sprites])
+            self.magic_player.heal(self.player, strength, cost)
             
         if style == 'flame':
-            self.magic_player.flame(self.player, cost, [self.visible_sprites, self.attack_sprites])
+            self.magic_player.flame(self.player, cost)
     
     def destroy_attack(self):
-        # Remove current attack sprite from all groups.
+        # Remove current attack sprite from all groups and return it to the pool.
         if self.current_attack:
             self.current_attack.kill()
+            self.free_weapons.append(self.current_attack)
         self.current_attack = None
     
     def destroy_grass(self):
@@ -178,16 +352,21 @@ class Level():
             collision_sprites = pygame.sprite.spritecollide(attack_sprite, self.attackable_sprites, False)
             for sprite in collision_sprites:
                 if sprite.sprite_type == 'grass':
-                    x = sprite.rect.centerx // TILESIZE
-                    y = sprite.rect.centery // TILESIZE
-                    
-                    if 0 <= y < len(self.pathfinding_grid) and 0 <= x < len(self.pathfinding_grid[0]):
-                        self.pathfinding_grid[y][x] = True
+                    self._free_tile(sprite)
                     
                     pos = sprite.rect.center
                     self.animation_player.create_grass_particles(pos)
                     sprite.kill()
     
+    def _free_tile(self, sprite):
+        # Mark a destroyed obstacle's tile as walkable for pathfinding and steering.
+        x = sprite.rect.centerx // TILESIZE
+        y = sprite.rect.centery // TILESIZE
+        
+        if 0 <= y < len(self.pathfinding_grid) and 0 <= x < len(self.pathfinding_grid[0]):
+            self.pathfinding_grid[y][x] = True
+            self.obstacle_field.update_cell(x, y)
+    
     def player_attack_logic(self):
         # Check for collisions between attack sprites and attackable entities.
         if self.attack_sprites:
@@ -196,30 +375,45 @@ class Level():
 
                 if collision_sprite:
                     for target_sprite in collision_sprite:
-                        if target_sprite.sprite_type == 'grass':
-                            pos = target_sprite.rect.center
-                            offset = pygame.math.Vector2(0,75)
-                    
-                            for leaf in range(randint(3,6)):
-                                self.animation_player.create_grass_particles(pos - offset, [self.visible_sprites])
-                            
-                            target_sprite.kill()
-                        else: 
-                            target_sprite.get_damge(self.player, attack_sprite.sprite_type)
+                        self._hit_target(target_sprite, attack_sprite.sprite_type)
+    
+    def _hit_target(self, target_sprite, attack_type):
+        # Apply a player attack to grass or an enemy.
+        if not target_sprite.alive():
+            return
+        
+        if target_sprite.sprite_type == 'grass':
+            pos = target_sprite.rect.center
+            offset = pygame.math.Vector2(0,75)
+    
+            for leaf in range(randint(3,6)):
+                self.animation_player.create_grass_particles(pos - offset)
+            
+            self._free_tile(target_sprite)
+            target_sprite.kill()
+        else: 
+            target_sprite.get_damge(self.player, attack_type)
+    
+    def _attack_targets(self, rect):
+        # Attackable sprites overlapping rect, looked up through the spatial indexes.
+        query_rect = rect.inflate(TILESIZE, TILESIZE)
+        targets = [sprite for sprite in self.spatial_grid.query(query_rect)
+                   if sprite.sprite_type == 'grass' and sprite.rect.colliderect(rect)]
+        targets.extend(enemy for enemy in self.lod_scheduler.enemy_grid.query(query_rect)
+                       if enemy.rect.colliderect(rect))
+        return targets
     
     def damage_player(self, amount, attack_type, source_pos=None):
         # Apply damage to player if not currently invulnerable.
         if self.player.vulnerable:
-            self.player.health -= amount
-            self.player.vulnerable = False
-            self.player.hurt_time = pygame.time.get_ticks()
-            self.animation_player.create_particles(attack_type, self.player.rect.center, [self.visible_sprites])
+            self.player.take_hit(amount)
+            self.animation_player.create_particles(attack_type, self.player.rect.center)
             if source_pos is not None:
                 self.player.apply_knockback(source_pos)
             
     def trigger_death_particles(self, pos, particle_type): 
         # Spawn particle effect at specified position.
-        self.animation_player.create_particles(particle_type, pos, [self.visible_sprites])
+        self.animation_player.create_particles(particle_type, pos)
         
     def add_exp(self, amount):
         # Add experience points to player.
@@ -228,6 +422,7 @@ class Level():
     def toggle_menu(self):
         # Toggle pause state for upgrade menu.
         self.game_paused = not self.game_paused
+        self.paused_snapshot = None
         if self.game_paused and self.input_manager:
             # Require the player to press the quit input while in the menu
             self.input_manager.consume_quit_request()
@@ -272,13 +467,26 @@ class Level():
                 continue
 
             if len(points) > 1:
-                pygame.draw.lines(self.display_surface, (255, 215, 0), False, points, 2)
+                pygame.draw.lines(self.world_surface, (255, 215, 0), False, points, 2)
 
             for point in points:
-                pygame.draw.circle(self.display_surface, (255, 140, 0), point, 4)
+                pygame.draw.circle(self.world_surface, (255, 140, 0), point, 4)
 
-    def run(self):
-        # Main level update and render loop.
+    def run(self, dt=None):
+        """
+        Advance the simulation in fixed steps and render one frame.
+        
+        Algorithm (fixed timestep with accumulator):
+        1. Add the elapsed frame time to the accumulator
+        2. Run whole SIMULATION_STEP_MS steps while enough time is banked,
+           at most MAX_CATCH_UP_STEPS per frame (the backlog is dropped after
+           that so a slow frame can't snowball)
+        3. Render with the leftover fraction so moving sprites are drawn
+           between their previous and current positions
+        
+        Args:
+            dt: Milliseconds since the previous frame (None runs exactly one step)
+        """
         # Check for player death
         if self.player.health <= 0:
             self.is_dead = True
@@ -296,40 +504,116 @@ class Level():
                 pygame.quit()
                 sys.exit()
             return
+               
+        if self.game_paused:
+            # No simulation while paused; don't bank time for a burst on resume
+            self.accumulator = 0
+            self._render_paused()
+            self.upgrade.display()
+            if self.upgrade.consume_quit_request():
+                pygame.quit()
+                sys.exit()
+            return
+        
+        self.accumulator += SIMULATION_STEP_MS if dt is None else dt
+        steps = 0
+        while self.accumulator >= SIMULATION_STEP_MS and steps < MAX_CATCH_UP_STEPS:
+            self._simulate()
+            self.accumulator -= SIMULATION_STEP_MS
+            steps += 1
+            if self.player.health <= 0 or self.game_complete:
+                break
+        
+        if self.accumulator >= SIMULATION_STEP_MS:
+            # Too far behind: drop the backlog instead of spiralling
+            self.accumulator %= SIMULATION_STEP_MS
+        
+        self._render(self.accumulator / SIMULATION_STEP_MS)
 
-        # Rebuild spatial grid each frame
+    def _simulate(self):
+        # Advance game state by one fixed step.
+        # Rebuild spatial grid each step
         self._rebuild_spatial_grid()
+        
+        self.sim_time += SIMULATION_STEP_MS
+        self.timers.update(self.sim_time)
+        self.particles.update()
+        active_enemies = self.lod_scheduler.schedule(self.player)
+        self.visible_sprites.update(active_enemies)
+        self.enemy_system.update(self.player, active_enemies, self.lod_scheduler.nearby)
+        self.lod_scheduler.refresh(active_enemies)
+        self.player_attack_logic()
+        self.projectiles.update()
+        self._check_game_completion()
 
-        # Render sprites and UI
-        self.visible_sprites.custom_draw(self.player)
-        self.ui.display(self.player)
+    def _create_world_surface(self):
+        # Offscreen target for the world at RENDER_RESOLUTION (the display itself when unset).
+        if RENDER_RESOLUTION is None or tuple(RENDER_RESOLUTION) == self.display_surface.get_size():
+            return self.display_surface
+        return pygame.Surface(RENDER_RESOLUTION).convert()
+    
+    def _present_world(self):
+        # Upscale the offscreen world onto the display in one pass.
+        if self.world_surface is self.display_surface:
+            return
+        scale = pygame.transform.smoothscale if RENDER_SMOOTH_SCALE else pygame.transform.scale
+        scale(self.world_surface, self.display_surface.get_size(), self.display_surface)
+    
+    def _draw_world(self, alpha):
+        # Draw sprites (with particles), projectiles and debug overlays into the world surface.
+        if self.world_surface is not self.display_surface:
+            self.world_surface.fill(WATER_COLOR)  # Only the display is cleared by the main loop
+        self.visible_sprites.custom_draw(self.player, alpha)
+        self.projectiles.draw(self.world_surface, self.visible_sprites.offset, alpha)
+        if DEBUG_MODE:
+            self.spatial_grid.visualize_debug(self.world_surface, self.visible_sprites.offset)
+            self._draw_enemy_paths_debug()
+    
+    def _present_frame(self):
+        # Add the HUD and bring the world surface to the display.
+        if RENDER_UI_NATIVE:
+            self._present_world()
+            self.ui.display(self.player)
+        else:
+            self.ui.display(self.player)
+            self._present_world()
+    
+    def _render_paused(self):
+        # The world is frozen while paused: draw it once, then reuse the snapshot.
+        if self.paused_snapshot is None:
+            self._draw_world(1.0)
+            self.paused_snapshot = self.world_surface.copy()
+        else:
+            self.world_surface.blit(self.paused_snapshot, (0, 0))
+        self._present_frame()
+    
+    def _render(self, alpha):
+        # Render sprites and UI, interpolating moving sprites by alpha (0..1).
+        self._draw_world(alpha)
+        self._present_frame()
         
-        # Debug: Visualize spatial grid (only if DEBUG_MODE is True)
+        # Debug: Show stats (only if DEBUG_MODE is True)
         if DEBUG_MODE:
-            self.spatial_grid.visualize_debug(self.display_surface, self.visible_sprites.offset)
-
-            # Show stats
             stats = self.spatial_grid.get_stats()
             from debug import debug
             debug(f"Spatial Grid - Sprites: {stats['total_sprites']}, Cells: {stats['total_cells']}", y=40)
             debug(f"Max/Cell: {stats['max_sprites_per_cell']}, Queries: {stats['queries_this_frame']}", y=70)
-            self._draw_enemy_paths_debug()
-               
-        if self.game_paused:
-            self.upgrade.display()
-            if self.upgrade.consume_quit_request():
-                pygame.quit()
-                sys.exit()
-        else:
-            # Update game state only when not paused
-            self.visible_sprites.update()
-            self.visible_sprites.enemy_update(self.player)
-            self.player_attack_logic()
-            self._check_game_completion()
+            lod_stats = self.lod_scheduler.get_stats()
+            debug(f"Enemy LOD - Full: {lod_stats['full']}, Reduced: {lod_stats['reduced']}, Dormant: {lod_stats['dormant']}", y=100)
+            pool_stats = self.enemy_pool.get_stats()['total']
+            debug(f"Enemy Pool - Active: {pool_stats['active']}, Free: {pool_stats['free']}, Created: {pool_stats['created']}", y=130)
+            projectile_stats = self.projectiles.get_stats()
+            debug(f"Projectiles - Active: {projectile_stats['active']}/{projectile_stats['capacity']}, Dropped: {projectile_stats['dropped']}", y=160)
+            particle_stats = self.particles.get_stats()
+            debug(f"Particles - Active: {particle_stats['active']}/{particle_stats['capacity']}, Dropped: {particle_stats['dropped']}", y=190)
 
     def _check_game_completion(self):
         if self.game_complete:
             return
+        
+        # Arena waves never run out
+        if self.wave_spawner is not None and self.wave_spawner.active:
+            return
 
         for sprite in self.visible_sprites:
             if getattr(sprite, 'sprite_type', None) == 'enemy':
@@ -339,34 +623,179 @@ class Level():
 
         
 class YSortCameraGroup(pygame.sprite.Group):
-    # Custom sprite group with camera offset and Y-axis sorting for depth.
+    """
+    Custom sprite group with camera offset and Y-axis sorting for depth.
+    
+    Only sprites inside the camera are sorted and drawn, and the draw order
+    is maintained incrementally instead of sorting the whole group per frame.
+    Draw entries are (centery, insertion number, sprite) tuples, so ties keep
+    insertion order.
+    
+    - Map tiles (grass, objects) are static: they are baked into chunked
+      depth bands by StaticChunkLayer, sorted once per chunk, so the screen
+      takes tens of large blits instead of one per tile.
+    - Entities and weapons are dynamic: they are indexed by rect
+      in a spatial hash grid (re-hashed after they update). The on-screen
+      ones persist in a nearly-sorted list that an insertion-sort pass fixes
+      each frame, since they move only a few pixels at a time.
+    - Only dynamic sprites are updated: tiles are never visited, and enemies
+      are kept in their own set so that, given an LOD set, dormant ones are
+      skipped without being iterated.
+    - Particles come from the level's ParticleSystem as already sorted
+      entries whose tie-break numbers are reserved from this group.
+    - The sorted static bands, the dynamic list and the particles are
+      merged while drawing.
+    """
     
-    def __init__(self):
+    def __init__(self, surface=None):
        super().__init__()
        
-       self.display_surface = pygame.display.get_surface()
+       # Render target (an offscreen surface when the world renders at RENDER_RESOLUTION)
+       self.display_surface = surface if surface is not None else pygame.display.get_surface()
        self.half_width = self.display_surface.get_size()[0] // 2
        self.half_height = self.display_surface.get_size()[1] // 2
        self.offset = pygame.math.Vector2()
        
-       self.floor_surface = pygame.image.load('graphics/tilemap/ground.png').convert()
-       self.floor_rect = self.floor_surface.get_rect(topleft = (0,0))
+       # Floor texture, streamed in tiles around the camera
+       self.floor = FloorStreamer('graphics/tilemap/ground.png')
+       
+       # Entity centers before the latest simulation step (for render interpolation)
+       self.previous_centers = {}
+       
+       # Static tiles, baked into chunks of depth bands (rebaked when grass is cut)
+       self.static_layer = StaticChunkLayer()
+       
+       # Dynamic sprites: culling grid keyed by draw rect + on-screen order from last frame
+       self.dynamic_grid = SpatialHashGrid(cell_size=TILESIZE * 4, bounds='rect')
+       self._dynamic_order = []
+       
+       self._draw_sequence = {}  # sprite -> insertion number (stable tie-break for the Y-sort)
+       self._next_sequence = 0
+       self._pending = []  # Added sprites not indexed yet (Sprite.__init__ joins groups before setting rect)
+       self._updatables = {}  # Dynamic non-enemy sprites (ordered set)
+       self._enemies = {}  # Enemy sprites (ordered set), updated only when scheduled
+       
+       self.particles = None  # ParticleSystem merged into the Y-sort (set by Level)
+    
+    def reserve_draw_sequence(self):
+        # Insertion number for a drawable that is not a sprite of this group.
+        sequence = self._next_sequence
+        self._next_sequence += 1
+        return sequence
+    
+    def add_internal(self, sprite, layer=None):
+        super().add_internal(sprite, layer)
+        self._draw_sequence[sprite] = self._next_sequence
+        self._next_sequence += 1
+        self._pending.append(sprite)
+    
+    def remove_internal(self, sprite):
+        super().remove_internal(sprite)
+        self._draw_sequence.pop(sprite, None)
+        self._updatables.pop(sprite, None)
+        self._enemies.pop(sprite, None)
+        self.dynamic_grid.remove(sprite)
+        self.static_layer.remove(sprite)
+    
+    def _index_pending(self):
+        # Insert newly added sprites into the static layer or the dynamic grid.
+        for sprite in self._pending:
+            sequence = self._draw_sequence.get(sprite)
+            if sequence is None:
+                continue
+            if isinstance(sprite, Tile):
+                self.static_layer.add(sprite, sequence)
+            else:
+                self.dynamic_grid.insert(sprite)
+                if getattr(sprite, 'sprite_type', None) == 'enemy':
+                    self._enemies[sprite] = None
+                else:
+                    self._updatables[sprite] = None
+        self._pending.clear()
+    
+    def _interpolation_shift(self, sprite, alpha):
+        # Offset from the sprite's current position back towards its previous one.
+        previous = self.previous_centers.get(sprite)
+        if previous is None or alpha >= 1:
+            return pygame.math.Vector2()
+        return (pygame.math.Vector2(previous) - sprite.rect.center) * (1 - alpha)
+    
+    def _visible_dynamic(self, query_rect):
+        # On-screen dynamic sprites as sorted entries, reusing last frame's order.
+        visible = {sprite for sprite in self.dynamic_grid.query(query_rect) if sprite.rect.colliderect(query_rect)}
+        order = [sprite for sprite in self._dynamic_order if sprite in visible]
+        if len(order) != len(visible):
+            known = set(order)
+            order.extend(sprite for sprite in visible if sprite not in known)
+        
+        sequence = self._draw_sequence
+        entries = [(sprite.rect.centery, sequence[sprite], sprite) for sprite in order]
+        
+        # Insertion sort: near-linear because sprites barely move between frames
+        for i in range(1, len(entries)):
+            entry = entries[i]
+            j = i - 1
+            while j >= 0 and entries[j] > entry:
+                entries[j + 1] = entries[j]
+                j -= 1
+            entries[j + 1] = entry
+        
+        self._dynamic_order = [entry[2] for entry in entries]
+        return entries
+    
+    def draw_order(self):
+        # Drawables (static bands and sprites) overlapping the camera, in draw order.
+        self._index_pending()
+        camera_rect = pygame.Rect((int(self.offset.x), int(self.offset.y)), self.display_surface.get_size())
+        query_rect = camera_rect.inflate(TILESIZE * 2, TILESIZE * 2)
+        
+        slices = self.static_layer.visible(query_rect)
+        slices.append(self._visible_dynamic(query_rect))
+        if self.particles is not None:
+            slices.append(self.particles.draw_entries(query_rect))
+        return [entry[2] for entry in heapq.merge(*slices)]
        
-    def custom_draw(self, player):
-        # Render all sprites with camera offset centered on player.
-        self.offset.x = player.rect.centerx - self.half_width
-        self.offset.y = player.rect.centery - self.half_height
+    def custom_draw(self, player, alpha=1.0):
+        # Render on-screen sprites with camera offset centered on player (interpolated by alpha).
+        player_shift = self._interpolation_shift(player, alpha)
+        self.offset.x = player.rect.centerx + player_shift.x - self.half_width
+        self.offset.y = player.rect.centery + player_shift.y - self.half_height
        
-        offset_floor = self.floor_rect.topleft - self.offset
-        self.display_surface.blit(self.floor_surface, offset_floor)
+        self.floor.draw(self.display_surface, self.offset)
         
-        for sprite in sorted(self.sprites(), key = lambda sprite: sprite.rect.centery):
-            offset_pos = sprite.rect.topleft - self.offset
-            self.display_surface.blit(sprite.image, offset_pos)
+        # Build the whole draw list with integer positions, then blit it in one call
+        offset_x = self.offset.x
+        offset_y = self.offset.y
+        previous_centers = self.previous_centers if alpha < 1 else {}
+        remaining = 1 - alpha
+        blit_sequence = []
+        for sprite in self.draw_order():
+            rect = sprite.rect
+            x = rect.x - offset_x
+            y = rect.y - offset_y
+            previous = previous_centers.get(sprite)
+            if previous is not None:
+                x += (previous[0] - rect.centerx) * remaining
+                y += (previous[1] - rect.centery) * remaining
+            image_offset = sprite.image_offset
+            blit_sequence.append((sprite.image, (int(x) + image_offset[0], int(y) + image_offset[1])))
+        blit_batch(self.display_surface, blit_sequence)
             
-    def enemy_update(self,player):
-        # Update all enemy sprites with player position.
-        enemy_sprites = [sprite for sprite in self.sprites() if hasattr(sprite, 'sprite_type') and sprite.sprite_type == 'enemy']
+    def update(self, active_enemies=None):
+        # Update dynamic sprites in insertion order; when an LOD set is given, only those enemies are simulated.
+        self._index_pending()
+        if active_enemies is None:
+            enemies = list(self._enemies)
+        else:
+            enemies = [enemy for enemy in active_enemies if enemy in self._enemies]
+        sprites = list(self._updatables) + enemies
+        sprites.sort(key=self._draw_sequence.__getitem__)
         
-        for enemy in enemy_sprites:
-            enemy.enemy_update(player)
\ No newline at end of file
+        previous_centers = {}
+        for sprite in sprites:
+            if isinstance(sprite, Entity):
+                previous_centers[sprite] = sprite.rect.center
+            sprite.update()
+            if isinstance(sprite, Entity) and sprite in self.dynamic_grid:
+                self.dynamic_grid.move(sprite)
+        self.previous_centers = previous_centers
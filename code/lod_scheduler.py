@@ -0,0 +1,126 @@
+"""
+Enemy Simulation Level of Detail (LOD)
+
+Purpose: Stop paying full simulation cost for enemies the player can
+neither see nor interact with.
+
+Tiers (evaluated once per frame around the player):
+- FULL:    on screen or within the enemy's notice radius -> updated every frame
+- REDUCED: off screen but inside the activation margin -> updated every
+           LOD_REDUCED_INTERVAL frames
+- DORMANT: everything else -> not updated at all
+
+Dormant enemies are never iterated. A spatial activation query around the
+camera returns the only candidates that may need simulating, so idle
+monsters elsewhere on the map cost nothing per frame.
+
+Proximity index: a second query around the player, sized by the largest
+notice radius, yields the only enemies that can pursue or attack. Its result
+is cached and only recomputed when the player's query covers different grid
+cells or an enemy changed cells, so a player walking inside one cell costs a
+key comparison. EnemySystem evaluates the FSM for these enemies only.
+"""
+
+import pygame
+from settings import TILESIZE, LOD_ACTIVATION_MARGIN, LOD_REDUCED_INTERVAL, monster_data
+from spatial_hash import SpatialHashGrid
+
+
+class LODScheduler:
+
+    def __init__(self, cell_size=TILESIZE * 8, view_surface=None):
+        # Surface the world is rendered to (defines the camera size)
+        self.display_surface = view_surface if view_surface is not None else pygame.display.get_surface()
+
+        # Long-lived grid of enemies, updated incrementally as they move
+        self.enemy_grid = SpatialHashGrid(cell_size=cell_size)
+
+        # Per-enemy phase so reduced-rate updates spread across frames
+        self._phases = {}
+        self._next_phase = 0
+
+        # Player-centric proximity index (enemies that could notice the player)
+        self.proximity_radius = max(info['notice_radius'] for info in monster_data.values())
+        self.nearby = set()
+        self._nearby_key = None
+
+        self.frame = 0
+        self.stats = {'full': 0, 'reduced': 0, 'dormant': 0}
+
+    def register(self, enemy):
+        # Start tracking an enemy; it stays dormant until the player comes near.
+        self.enemy_grid.insert(enemy)
+        self._phases[enemy] = self._next_phase
+        self._next_phase = (self._next_phase + 1) % LOD_REDUCED_INTERVAL
+
+    def unregister(self, enemy):
+        # Stop tracking an enemy (death, despawn).
+        self.enemy_grid.remove(enemy)
+        self._phases.pop(enemy, None)
+
+    def _camera_rect(self, player):
+        # World-space rectangle shown on screen (matches YSortCameraGroup's offset).
+        camera_rect = pygame.Rect((0, 0), self.display_surface.get_size())
+        camera_rect.center = player.rect.center
+        return camera_rect
+
+    def nearby_enemies(self, player):
+        """
+        Return the enemies that may be within notice range of the player.
+        
+        The result is a superset (whole grid cells), recomputed only when
+        the query's cell range or the enemy grid changed since last time.
+        """
+        query_rect = pygame.Rect(0, 0, self.proximity_radius * 2, self.proximity_radius * 2)
+        query_rect.center = player.rect.center
+        key = (self.enemy_grid.cell_range(query_rect), self.enemy_grid.version)
+
+        if key != self._nearby_key:
+            self.nearby = self.enemy_grid.query(query_rect)
+            self._nearby_key = key
+        return self.nearby
+
+    def schedule(self, player):
+        """
+        Return the set of enemies that should be simulated this frame.
+
+        Algorithm:
+        1. Query the enemy grid with the camera rect grown by the activation margin
+        2. Enemies on screen or near the player (proximity index) run at full rate
+        3. The remaining candidates run on a staggered, reduced cadence
+        4. Enemies not returned by the query stay dormant
+        """
+        self.frame += 1
+        camera_rect = self._camera_rect(player)
+        activation_rect = camera_rect.inflate(LOD_ACTIVATION_MARGIN * 2, LOD_ACTIVATION_MARGIN * 2)
+        candidates = self.enemy_grid.query(activation_rect)
+        nearby = self.nearby_enemies(player)
+
+        scheduled = set()
+        full = reduced = 0
+
+        for enemy in candidates:
+            if (enemy in nearby or
+                    camera_rect.colliderect(enemy.rect) or
+                    not enemy.vulnerable):
+                scheduled.add(enemy)
+                full += 1
+            elif (self.frame + self._phases.get(enemy, 0)) % LOD_REDUCED_INTERVAL == 0:
+                scheduled.add(enemy)
+                reduced += 1
+
+        self.stats['full'] = full
+        self.stats['reduced'] = reduced
+        self.stats['dormant'] = len(self.enemy_grid) - len(candidates)
+        return scheduled
+
+    def refresh(self, enemies):
+        # Re-hash enemies that were simulated this frame and drop the dead ones.
+        for enemy in enemies:
+            if enemy.alive():
+                self.enemy_grid.move(enemy)
+            else:
+                self.unregister(enemy)
+
+    def get_stats(self):
+        return self.stats.copy()
@@ -1,16 +1,19 @@
 import pygame
 from settings import *
 from random import randint
+from asset_registry import AssetRegistry
 
 class MagicPlayer:
-    def __init__(self, animation_player):
+    def __init__(self, animation_player, projectiles):
         self.animation_player = animation_player
+        self.projectiles = projectiles
+        self.projectiles.register_frames('flame', animation_player.frames['flame'])
         self.sounds = {
-            'heal': pygame.mixer.Sound('audio/heal.wav'),
-            'flame': pygame.mixer.Sound('audio/Fire.wav')
+            'heal': AssetRegistry.sound('audio/heal.wav'),
+            'flame': AssetRegistry.sound('audio/Fire.wav')
         }
         
-    def heal(self, player, strength, cost, groups):
+    def heal(self, player, strength, cost):
         # Restore player health if sufficient energy available.
         if player.energy >= cost:
             self.sounds['heal'].play()
@@ -21,11 +24,11 @@ class MagicPlayer:
             if player.health >= player.stats['health']:
                 player.health = player.stats['health']
         
-            self.animation_player.create_particles('aura', player.rect.center, groups)
-            self.animation_player.create_particles('heal', player.rect.center, groups)          
+            self.animation_player.create_particles('aura', player.rect.center)
+            self.animation_player.create_particles('heal', player.rect.center)          
                     
-    def flame(self, player, cost, groups):
-        # Spawn flame particles in direction player is facing.
+    def flame(self, player, cost):
+        # Launch flame projectiles in direction player is facing.
         if player.energy >= cost:
             player.energy -= cost
             self.sounds['flame'].play()
@@ -36,18 +39,18 @@ class MagicPlayer:
             elif player.status.split('_')[0] == 'up': direction = pygame.math.Vector2(0,-1)
             else: direction = pygame.math.Vector2(0,1)
             
-            # Spawn 5 flame particles with increasing distance
+            # Spawn 5 flames with increasing distance
             for i in range(1,6):
                 if direction.x: 
                     # Horizontal flame spread
                     offset_x = (direction.x * i) * TILESIZE
                     x = player.rect.centerx + offset_x + randint(- TILESIZE // 3, TILESIZE // 3)
                     y = player.rect.centery + randint(- TILESIZE // 3, TILESIZE // 3)
-                    self.animation_player.create_particles('flame',(x,y) , groups)
                                         
                 else: 
                     # Vertical flame spread
                     offset_y = (direction.y * i) * TILESIZE
                     x = player.rect.centerx + randint(- TILESIZE // 3, TILESIZE // 3)
                     y = player.rect.centery +  offset_y + randint(- TILESIZE // 3, TILESIZE // 3)
-                    self.animation_player.create_particles('flame',(x,y) , groups)
\ No newline at end of file
+                
+                self.projectiles.spawn('flame', (x,y))
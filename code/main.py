@@ -2,8 +2,9 @@ import pygame
 import sys
 import os
 from datetime import datetime
-from settings import WATER_COLOR, FPS
-from level import Level
+from settings import (WATER_COLOR, FPS, IDLE_WAIT_MS, UI_FONT, UI_FONT_SIZE, UI_BG_COLOR,
+                      UI_BORDER_COLOR, TEXT_COLOR, BAR_COLOR)
+from level import LevelBuilder
 from start_screen import StartScreen
 from input_manager import InputManager
 from save_manager import SaveManager
@@ -18,6 +19,8 @@ class Game:
         self.screen = pygame.display.set_mode((display_info.current_w, display_info.current_h), pygame.FULLSCREEN)
         pygame.display.set_caption('Aetherbound')
         self.clock = pygame.time.Clock()
+        self.frame_time = 0  # Milliseconds taken by the previous frame
+        self.presented_view = None  # Idle view currently on the display (None while animating)
         
         # Debug: Print current working directory
         print(f"Current working directory: {os.getcwd()}")
@@ -29,6 +32,7 @@ class Game:
         
         # Level is instantiated after player starts the game
         self.level = None
+        self.level_builder = None  # Next level, built speculatively on the start and death screens
         
         # Background music - starts when game begins
         self.main_sound = pygame.mixer.Sound('audio/main.ogg')
@@ -51,17 +55,31 @@ class Game:
             on_load_slot_selected=self._on_load_slot_selected
         )
         
+        # Notification text surface, rendered when the text changes
+        self.notification_font = pygame.font.Font(None, 36)
+        self.notification_surf = None
+        self.notification_surf_text = None
+        
+        # Loading screen font (level start)
+        self.loading_font = pygame.font.Font(UI_FONT, UI_FONT_SIZE)
+        
         # Ensure saves directory exists
         SaveManager.ensure_save_dir_exists()
         
     def run(self):
         # Main game loop handling events, updates, and rendering.
         while True:
-            # Process all events first
-            for event in pygame.event.get():
+            # Spend spare frames on the start and death screens building the next level
+            self._update_level_builder()
+            
+            # Process all events first; static screens sleep until something happens
+            if self.presented_view is not None and self.presented_view == self._idle_view() and not self._building_level():
+                events = self._wait_events()
+            else:
+                events = pygame.event.get()
+            for event in events:
                 if event.type == pygame.QUIT:
-                    pygame.quit()
-                    sys.exit()
+                    self.quit()
                 
                 # Handle save slot menu input if visible (this takes priority)
                 if self.save_slot_menu.visible:
@@ -100,26 +118,104 @@ class Game:
             # Update game state and handle state transitions
             self._handle_state_transitions()
             self.input_manager.update()
-            self.screen.fill(WATER_COLOR)
             
             # Update start screen for hover effects
             if not self.game_started:
                 self.start_screen.update()
             
+            # Static screen that is already on the display: nothing to redraw
+            view = self._idle_view()
+            if view is not None and view == self.presented_view:
+                if view[0] == 'complete' and self.input_manager.consume_quit_request():
+                    self.quit()
+                self.clock.tick(FPS if self._building_level() else 0)
+                self.frame_time = 0  # Time spent idle is not simulation time
+                continue
+            
+            self.screen.fill(WATER_COLOR)
+            
             # Render current state
             if not self.game_started:
                 self.start_screen.draw()
             else:
-                self.level.run()
+                self.level.run(self.frame_time)
                 
             # Draw save slot menu if visible
             self.save_slot_menu.draw()
                 
             # Draw save/load notification if active
             self._draw_notification()
-                
-            pygame.display.update()
-            self.clock.tick(FPS)
+            
+            # Running level.run may have changed the view (death, completion)
+            view = self._idle_view()
+            rects = self._changed_rects(self.presented_view, view)
+            if rects is None:
+                pygame.display.update()
+            else:
+                pygame.display.update(rects)
+            self.presented_view = view
+            self.frame_time = self.clock.tick(FPS)
+            if view is not None:
+                self.frame_time = 0
+
+    def _idle_view(self):
+        """
+        Describe what a static screen currently shows.
+        
+        Returns:
+            Hashable tuple (screen, start selection, save menu state, notification)
+            that changes whenever the static frame would look different, or
+            None while something is animating (gameplay, upgrade menu)
+        """
+        if not self.game_started:
+            screen = 'start'
+        elif self.level.is_dead:
+            screen = 'dead'
+        elif self.level.game_complete:
+            screen = 'complete'
+        elif self.level.game_paused and self.save_slot_menu.visible:
+            screen = 'paused'
+        else:
+            return None
+        
+        selection = self.start_screen.selected_index if screen == 'start' else None
+        menu = None
+        if self.save_slot_menu.visible:
+            menu = (self.save_slot_menu.is_save_mode, self.save_slot_menu.selected_slot)
+        notification = None
+        if pygame.time.get_ticks() < self.save_notification_time and self.save_notification_text:
+            notification = self.save_notification_text
+        return (screen, selection, menu, notification)
+
+    def _changed_rects(self, previous, view):
+        # Display areas that differ between two idle views (None = whole screen).
+        if previous is None or view is None:
+            return None
+        if previous[0] != view[0] or previous[3] != view[3]:
+            return None
+        if (previous[2] is None) != (view[2] is None):
+            return None
+        
+        rects = []
+        if previous[1] != view[1]:
+            rects.extend(self.start_screen.option_rects)
+        if previous[2] != view[2]:
+            if previous[2][0] != view[2][0]:
+                return None
+            rects.append(self.save_slot_menu.slot_rect(previous[2][1]))
+            rects.append(self.save_slot_menu.slot_rect(view[2][1]))
+        return rects
+
+    def _wait_events(self):
+        # Block until an event arrives, or until a notification has to disappear.
+        timeout = IDLE_WAIT_MS
+        remaining = self.save_notification_time - pygame.time.get_ticks()
+        if remaining > 0 and self.save_notification_text:
+            timeout = min(timeout, remaining + 1)
+        event = pygame.event.wait(timeout)
+        if event.type == pygame.NOEVENT:
+            return []
+        return [event] + pygame.event.get()
 
     def _handle_state_transitions(self):
         # Handle transitions between game states.
@@ -171,8 +267,12 @@ class Game:
         if new_game and not load_save:
             SaveManager.delete_save(current_slot)
         
-        # Create new level instance
-        self.level = Level(input_manager=self.input_manager, game=self)
+        # Attach the speculatively built level, finishing it behind a loading bar if needed
+        builder = self.level_builder or LevelBuilder(input_manager=self.input_manager, game=self)
+        self.level_builder = None
+        self._finish_level_builder(builder)
+        self.level = builder.level
+        self.level.activate()
         
         # Restore the save slot
         self.save_slot = current_slot
@@ -185,6 +285,52 @@ class Game:
         self.main_sound.play(loops=-1)
 
     
+    def quit(self):
+        # Stop any background level building, then close the game.
+        if self.level_builder is not None:
+            self.level_builder.cancel()
+        pygame.quit()
+        sys.exit()
+
+    def _update_level_builder(self):
+        # Start or advance the next level's construction while the player is on the start or death screen.
+        if self.game_started and not getattr(self.level, 'is_dead', False):
+            return
+        if self.level_builder is None:
+            self.level_builder = LevelBuilder(input_manager=self.input_manager, game=self)
+        if not self.level_builder.done:
+            self.level_builder.update()
+
+    def _building_level(self):
+        return self.level_builder is not None and not self.level_builder.done
+
+    def _finish_level_builder(self, builder):
+        # Run the remaining build stages, drawing a loading bar if that takes more than a frame.
+        builder.update()
+        while not builder.done:
+            pygame.event.pump()
+            self._draw_loading(builder.progress)
+            pygame.display.update()
+            self.clock.tick(FPS)
+            builder.update()
+        self.presented_view = None
+
+    def _draw_loading(self, progress):
+        # Loading screen: caption and a progress bar in the UI style.
+        self.screen.fill(UI_BG_COLOR)
+        center_x, center_y = self.screen.get_width() // 2, self.screen.get_height() // 2
+
+        text_surf = self.loading_font.render('Loading', False, TEXT_COLOR)
+        self.screen.blit(text_surf, text_surf.get_rect(midbottom=(center_x, center_y - 20)))
+
+        bar_rect = pygame.Rect(0, 0, self.screen.get_width() // 3, 20)
+        bar_rect.center = (center_x, center_y)
+        fill_rect = bar_rect.copy()
+        fill_rect.width = int(bar_rect.width * progress)
+        pygame.draw.rect(self.screen, UI_BORDER_COLOR, bar_rect)
+        pygame.draw.rect(self.screen, BAR_COLOR, fill_rect)
+        pygame.draw.rect(self.screen, UI_BORDER_COLOR, bar_rect, 3)
+
     def set_save_slot(self, slot: int) -> bool:
         # Change the current save slot.
         if 0 <= slot < self.max_save_slots:
@@ -268,9 +414,11 @@ class Game:
         # Draw the current notification if active.
         current_time = pygame.time.get_ticks()
         if current_time < self.save_notification_time and self.save_notification_text:
-            # Set up font
-            font = pygame.font.Font(None, 36)
-            text_surface = font.render(self.save_notification_text, True, (255, 255, 255))
+            # Render the text once per notification
+            if self.notification_surf_text != self.save_notification_text:
+                self.notification_surf = self.notification_font.render(self.save_notification_text, True, (255, 255, 255))
+                self.notification_surf_text = self.save_notification_text
+            text_surface = self.notification_surf
             text_rect = text_surface.get_rect(center=(self.screen.get_width() // 2, 50))
             
             # Draw background
@@ -1,11 +1,190 @@
+"""
+Particles - Effect frames and a pooled, array-backed particle system
+
+Purpose: Play hit, death, magic and leaf effects without creating a
+ParticleEffect sprite per effect, Y-sorting it with the world and killing it
+through the sprite group machinery. Cutting grass alone spawns 3-6 effects
+per tile.
+
+Data layout (ParticleSystem): a fixed number of slots, preallocated once
+- top-left world position (from the first frame, like the sprite rect was)
+- frame index (fractional) and the animation (frame set) each slot plays
+- a Y-sort tie-break number and an active flag; free slots are recycled from a stack
+
+Per simulation step every live particle advances its frame index at once and
+finished ones return to the free stack. For drawing, the particles inside the
+view become Y-sort entries (center y, tie-break, drawable) that the camera
+group merges with the world sprites, so effects keep their depth against
+trees and entities. Each slot owns one reusable sprite-like drawable.
+Spawns beyond PARTICLE_CAPACITY are dropped.
+"""
+
+import numpy as np
 import pygame
 from random import choice
+from settings import PARTICLE_CAPACITY
 from support import import_folder
+from atlas import FrameList
+
+
+class ParticleDrawable:
+    # Sprite-like view of one particle slot for the Y-sorted draw list.
+    __slots__ = ('image', 'rect', 'image_offset')
+
+    def __init__(self):
+        self.image = None
+        self.rect = pygame.Rect(0, 0, 0, 0)
+        self.image_offset = (0, 0)
+
+
+class ParticleSystem:
+
+    def __init__(self, capacity=PARTICLE_CAPACITY, draw_sequence=None):
+        """
+        Args:
+            capacity: Maximum number of simultaneously live particles
+            draw_sequence: callable() -> Y-sort tie-break number for a new particle
+                (defaults to spawn order)
+        """
+        self.capacity = capacity
+        self.draw_sequence = draw_sequence
+        self.animation_speed = 0.15
+
+        self.positions = np.zeros((capacity, 2), dtype=np.int32)
+        self.centery = np.zeros(capacity, dtype=np.int32)
+        self.frame_index = np.zeros(capacity, dtype=np.float64)
+        self.frame_count = np.zeros(capacity, dtype=np.int32)
+        self.frame_set = np.zeros(capacity, dtype=np.int16)
+        self.sequence = np.zeros(capacity, dtype=np.int64)
+        self.active = np.zeros(capacity, dtype=bool)
+        self._free_slots = list(range(capacity - 1, -1, -1))
+        self._next_sequence = 0
+        self._drawables = [ParticleDrawable() for _ in range(capacity)]
+
+        # Registered animations: id -> frames / largest frame size
+        self.frame_sets = []
+        self.frame_extents = []
+        self._frame_set_ids = {}
+
+        self.stats = {'spawned': 0, 'dropped': 0, 'peak_active': 0}
+
+    def register_frames(self, name, frames):
+        # Make an animation available to spawn(); returns its id.
+        if name in self._frame_set_ids:
+            return self._frame_set_ids[name]
+        frame_set_id = len(self.frame_sets)
+        self.frame_sets.append(frames)
+        self.frame_extents.append((max(width for width, _ in frames.sizes),
+                                   max(height for _, height in frames.sizes)))
+        self._frame_set_ids[name] = frame_set_id
+        return frame_set_id
+
+    def spawn(self, name, pos):
+        """
+        Start an effect from a free slot.
+
+        Args:
+            name: Registered animation name
+            pos: World position of the effect center
+
+        Returns:
+            Slot index, or None if the pool is exhausted
+        """
+        if not self._free_slots:
+            self.stats['dropped'] += 1
+            return None
+
+        frame_set_id = self._frame_set_ids[name]
+        frames = self.frame_sets[frame_set_id]
+        rect = pygame.Rect((0, 0), frames.sizes[0])
+        rect.center = pos
+
+        slot = self._free_slots.pop()
+        self.positions[slot] = rect.topleft
+        self.centery[slot] = rect.centery
+        self.frame_index[slot] = 0
+        self.frame_count[slot] = len(frames)
+        self.frame_set[slot] = frame_set_id
+        if self.draw_sequence is not None:
+            self.sequence[slot] = self.draw_sequence()
+        else:
+            self.sequence[slot] = self._next_sequence
+            self._next_sequence += 1
+        self.active[slot] = True
+
+        self.stats['spawned'] += 1
+        live = self.capacity - len(self._free_slots)
+        if live > self.stats['peak_active']:
+            self.stats['peak_active'] = live
+        return slot
+
+    def clear(self):
+        self.active[:] = False
+        self._free_slots = list(range(self.capacity - 1, -1, -1))
+
+    def __len__(self):
+        return self.capacity - len(self._free_slots)
+
+    def update(self):
+        # Advance every live particle by one simulation step.
+        live = np.flatnonzero(self.active)
+        if len(live) == 0:
+            return
+
+        self.frame_index[live] += self.animation_speed
+        finished = live[self.frame_index[live] >= self.frame_count[live]]
+        if len(finished):
+            self.active[finished] = False
+            self._free_slots.extend(finished.tolist())
+
+    def draw_entries(self, view_rect):
+        """
+        Y-sort entries for the live particles overlapping a world rect.
+
+        Returns:
+            Sorted list of (center y, tie-break, drawable) tuples
+        """
+        live = np.flatnonzero(self.active)
+        if len(live) == 0:
+            return []
+
+        x = self.positions[live, 0]
+        y = self.positions[live, 1]
+        extents = np.array(self.frame_extents, dtype=np.int32)[self.frame_set[live]]
+        visible = ((x < view_rect.right) & (x + extents[:, 0] > view_rect.left) &
+                   (y < view_rect.bottom) & (y + extents[:, 1] > view_rect.top))
+        live = live[visible]
+        order = np.lexsort((self.sequence[live], self.centery[live]))
+        live = live[order]
+
+        frame_sets = self.frame_sets
+        drawables = self._drawables
+        entries = []
+        for slot, left, top, centery, sequence, frame_set_id, frame_index in zip(
+                live.tolist(), self.positions[live, 0].tolist(), self.positions[live, 1].tolist(),
+                self.centery[live].tolist(), self.sequence[live].tolist(),
+                self.frame_set[live].tolist(), self.frame_index[live].tolist()):
+            frames = frame_sets[frame_set_id]
+            frame = int(frame_index)
+            drawable = drawables[slot]
+            drawable.image = frames[frame]
+            drawable.rect.update((left, top), frames.sizes[frame])
+            drawable.image_offset = frames.offsets[frame]
+            entries.append((centery, sequence, drawable))
+        return entries
+
+    def get_stats(self):
+        stats = self.stats.copy()
+        stats['active'] = len(self)
+        stats['capacity'] = self.capacity
+        return stats
+
 
 class AnimationPlayer:
     
-    def __init__(self):
+    def __init__(self, particles):
         # Load all particle animation frames into memory.
+        self.particles = particles
         self.frames = {
             # Magic effects
             'flame': import_folder('graphics/particles/flame/frames'),
@@ -42,47 +221,31 @@ class AnimationPlayer:
                 )
             }
     
+        # Every animation is registered once; leaf variants get their own names
+        for name, frames in self.frames.items():
+            if name != 'leaf':
+                self.particles.register_frames(name, frames)
+        self.leaf_names = []
+        for index, frames in enumerate(self.frames['leaf']):
+            self.leaf_names.append(f'leaf{index}')
+            self.particles.register_frames(self.leaf_names[-1], frames)
+
     def reflect_images(self, frames):
         """Create horizontally flipped versions of animation frames."""
-        new_frames = []
+        new_frames = FrameList()
         
-        for frame in frames:
+        for frame, (offset_x, offset_y), size in zip(frames, frames.offsets, frames.sizes):
             flipped_frame = pygame.transform.flip(frame, True, False)
             new_frames.append(flipped_frame)
+            new_frames.offsets.append((size[0] - offset_x - frame.get_width(), offset_y))
+            new_frames.sizes.append(size)
             
-            return new_frames
+        return new_frames
         
-    def create_grass_particles(self, pos, groups):
+    def create_grass_particles(self, pos):
         """Spawn random leaf particle effect at position."""
-        animation_frames = choice(self.frames['leaf'])
-        ParticleEffect(pos, animation_frames, groups)
+        self.particles.spawn(choice(self.leaf_names), pos)
         
-    def create_particles(self, animation_type, pos, groups):
+    def create_particles(self, animation_type, pos):
         """Spawn specified particle effect at position."""
-        animation_frames = self.frames[animation_type]
-        ParticleEffect(pos, animation_frames, groups)
-        
-
-class ParticleEffect(pygame.sprite.Sprite):
-    
-    def __init__(self, pos, animation_frames, groups):
-        super().__init__(groups)
-        
-        self.sprite_type = 'magic'
-        self.frame_index = 0
-        self.animation_speed = 0.15
-        self.frames = animation_frames
-        self.image = self.frames[int(self.frame_index)]
-        self.rect = self.image.get_rect(center = pos) 
-        
-    def animate(self):
-        """Advance animation frame and destroy sprite when complete."""
-        self.frame_index += self.animation_speed
-        
-        if self.frame_index >= len(self.frames):
-            self.kill()
-        else:
-            self.image = self.frames[int(self.frame_index)]
-            
-    def update(self):
-        self.animate()
\ No newline at end of file
+        self.particles.spawn(animation_type, pos)
@@ -0,0 +1,241 @@
+"""
+Pixel Cache - Decoded images kept on disk and memory-mapped at startup
+
+Purpose: Skip PNG/JPEG decoding and display-format conversion for images that
+were already loaded on a previous launch.
+
+Files (in CACHE_DIR):
+- pixels.bin: the pixel rows of every cached image, already in the display's
+  alpha pixel format, each entry starting on a PIXEL_CACHE_ALIGN boundary
+- pixels.txt: one line per entry: source path, mtime (ns), file size, blob
+  offset, width, height and byte layout
+
+Algorithm:
+1. On first use the index is read and every listed source is stat'ed.
+   Entries whose source changed or disappeared are dropped from the index
+   (their images decode again when loaded); the blob is compacted once dead
+   pixels outweigh live ones. A damaged index discards both files.
+2. The blob is memory-mapped (copy-on-write) and each hit becomes a surface
+   directly over the mapped pixels: no decode, no conversion, no copy.
+3. Misses are decoded and converted as before, then appended to the blob and
+   the index; the blob is re-mapped when a later load needs an entry that
+   was appended after the current map was made.
+
+Decoding and conversion are split so an AssetLoader can decode misses on
+worker threads (decode) and convert them on the main thread (preload).
+
+If the cache can't be written (read-only install), images load normally.
+"""
+
+import mmap
+import os
+import sys
+import pygame
+from settings import CACHE_DIR
+
+PIXEL_CACHE_ALIGN = 64  # Blitters expect aligned pixel rows
+
+# Byte layouts pygame.image.frombuffer understands, by (R, G, B, A) masks
+_LAYOUTS = {
+    (0xff0000, 0xff00, 0xff, 0xff000000): 'BGRA',
+    (0xff, 0xff00, 0xff0000, 0xff000000): 'RGBA',
+    (0xff00, 0xff0000, 0xff000000, 0xff): 'ARGB',
+}
+
+
+class PixelCache:
+
+    def __init__(self, directory=CACHE_DIR):
+        self.blob_path = os.path.join(directory, 'pixels.bin')
+        self.index_path = os.path.join(directory, 'pixels.txt')
+
+        self.entries = {}   # path -> (mtime, size, offset, width, height, layout)
+        self._blob = None   # Memory map of the blob
+        self._old_maps = []  # Earlier maps, still backing surfaces handed out
+        self._opened = False
+        self._writable = True
+        self._layout = None  # Byte layout of the display's alpha format
+        self._preloaded = {}  # path -> converted surface waiting for its load()
+
+        self.stats = {'hits': 0, 'misses': 0}
+
+    @staticmethod
+    def _key(path):
+        return os.path.normpath(path)
+
+    @staticmethod
+    def _source_stamp(path):
+        stat = os.stat(path)
+        return stat.st_mtime_ns, stat.st_size
+
+    def _display_layout(self):
+        # frombuffer layout that matches convert_alpha() on this display, if any.
+        masks = tuple(pygame.Surface((1, 1), pygame.SRCALPHA).convert_alpha().get_masks())
+        if sys.byteorder != 'little':
+            return None
+        return _LAYOUTS.get(masks)
+
+    def _open(self):
+        # Read and validate the index, then map the blob.
+        self._opened = True
+        self._layout = self._display_layout()
+        try:
+            with open(self.index_path) as index_file:
+                lines = index_file.read().splitlines()
+            blob_size = os.path.getsize(self.blob_path)
+        except OSError:
+            self._reset()
+            return
+
+        stale = 0
+        try:
+            for line in lines:
+                path, mtime, size, offset, width, height, layout = line.split('\t')
+                entry = (int(mtime), int(size), int(offset), int(width), int(height), layout)
+                try:
+                    current = self._source_stamp(path)
+                except OSError:
+                    current = None
+                if current != entry[:2] or entry[2] + entry[3] * entry[4] * 4 > blob_size:
+                    stale += 1  # Source changed or vanished: drop only this entry
+                    continue
+                self.entries[path] = entry
+        except ValueError:
+            # Damaged index: rebuild everything
+            self._reset()
+            return
+
+        if stale:
+            self._compact(blob_size)
+        self._map()
+
+    def _compact(self, blob_size):
+        # Rewrite the index without stale entries; move live pixels to a fresh blob once dead space outweighs them.
+        live_size = sum(width * height * 4 for _, _, _, width, height, _ in self.entries.values())
+        try:
+            if blob_size - live_size > live_size:
+                entries = {}
+                with open(self.blob_path, 'rb') as old_blob, open(self.blob_path + '.tmp', 'wb') as new_blob:
+                    for key, (mtime, size, offset, width, height, layout) in self.entries.items():
+                        old_blob.seek(offset)
+                        pixels = old_blob.read(width * height * 4)
+                        position = new_blob.tell()
+                        new_offset = -(-position // PIXEL_CACHE_ALIGN) * PIXEL_CACHE_ALIGN
+                        new_blob.write(bytes(new_offset - position))
+                        new_blob.write(pixels)
+                        entries[key] = (mtime, size, new_offset, width, height, layout)
+                open(self.index_path, 'w').close()  # Never leave the old offsets next to the new blob
+                os.replace(self.blob_path + '.tmp', self.blob_path)
+                self.entries = entries
+            with open(self.index_path + '.tmp', 'w') as index_file:
+                for key, entry in self.entries.items():
+                    index_file.write(self._index_line(key, entry))
+            os.replace(self.index_path + '.tmp', self.index_path)
+        except OSError:
+            self._writable = False
+
+    @staticmethod
+    def _index_line(key, entry):
+        return '\t'.join(map(str, (key,) + tuple(entry))) + '\n'
+
+    def _map(self):
+        # (Re)map the whole blob; surfaces over the previous map keep it alive.
+        if not os.path.exists(self.blob_path) or os.path.getsize(self.blob_path) == 0:
+            return
+        if self._blob is not None:
+            self._old_maps.append(self._blob)
+        with open(self.blob_path, 'rb') as blob_file:
+            self._blob = mmap.mmap(blob_file.fileno(), 0, access=mmap.ACCESS_COPY)
+
+    def _reset(self):
+        # Start an empty cache.
+        self.entries = {}
+        try:
+            os.makedirs(os.path.dirname(self.blob_path), exist_ok=True)
+            open(self.blob_path, 'wb').close()
+            open(self.index_path, 'w').close()
+        except OSError:
+            self._writable = False
+
+    def _append(self, key, stamp, surface):
+        # Store a converted surface for the next launch.
+        layout = self._layout or 'RGBA'
+        pixels = pygame.image.tobytes(surface, layout)
+        try:
+            with open(self.blob_path, 'ab') as blob_file:
+                position = blob_file.tell()
+                offset = -(-position // PIXEL_CACHE_ALIGN) * PIXEL_CACHE_ALIGN
+                blob_file.write(bytes(offset - position))
+                blob_file.write(pixels)
+            width, height = surface.get_size()
+            entry = (stamp[0], stamp[1], offset, width, height, layout)
+            with open(self.index_path, 'a') as index_file:
+                index_file.write(self._index_line(key, entry))
+            self.entries[key] = entry
+        except OSError:
+            self._writable = False
+
+    def contains(self, path):
+        # True if load(path) will be served without decoding.
+        if not self._opened:
+            self._open()
+        key = self._key(path)
+        return key in self.entries or key in self._preloaded
+
+    @classmethod
+    def decode(cls, path):
+        # Read and decode a source image; safe to call from worker threads.
+        stamp = cls._source_stamp(path)
+        return stamp, pygame.image.load(path)
+
+    def _convert(self, key, stamp, decoded):
+        # Display conversion of a decoded image, stored for the next launch.
+        surface = decoded.convert_alpha()
+        self.stats['misses'] += 1
+        if self._writable:
+            self._append(key, stamp, surface)
+        return surface
+
+    def preload(self, path, stamp, decoded):
+        # Convert an image decoded by decode() and keep it for the next load(path).
+        if not self._opened:
+            self._open()
+        key = self._key(path)
+        self._preloaded[key] = self._convert(key, stamp, decoded)
+
+    def load(self, path):
+        """
+        Load an image converted for per-pixel alpha blitting.
+
+        Equivalent to pygame.image.load(path).convert_alpha(), served from
+        a preloaded surface or the memory-mapped blob when the source is unchanged.
+        """
+        if not self._opened:
+            self._open()
+        key = self._key(path)
+
+        surface = self._preloaded.pop(key, None)
+        if surface is not None:
+            return surface
+
+        entry = self.entries.get(key)
+        if entry is not None:
+            _, _, offset, width, height, layout = entry
+            if self._blob is None or offset + width * height * 4 > len(self._blob):
+                self._map()
+            pixels = memoryview(self._blob)[offset:offset + width * height * 4]
+            surface = pygame.image.frombuffer(pixels, (width, height), layout)
+            self.stats['hits'] += 1
+            if layout != self._layout:
+                surface = surface.convert_alpha()
+            return surface
+
+        return self._convert(key, *self.decode(path))
+
+
+shared_cache = PixelCache()
+
+
+def load_image(path):
+    # pygame.image.load(path).convert_alpha() through the shared pixel cache.
+    return shared_cache.load(path)
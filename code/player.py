@@ -2,13 +2,14 @@ import pygame
 from settings import *
 from support import *
 from entity import *
+from asset_registry import AssetRegistry
 
 class Player(Entity):
     
     def __init__(self, pos, groups, obstacle_sprites, create_attack, destroy_attack, create_magic, input_manager=None):
         super().__init__(groups)
         
-        self.image = pygame.image.load('graphics/player/down_idle/idle_down.png').convert_alpha()
+        self.image = load_image('graphics/player/down_idle/idle_down.png')
         self.rect = self.image.get_rect(topleft = pos)
         self.hitbox = self.rect.inflate(-6 , HITBOX_OFFSET['player'])
         
@@ -52,8 +53,7 @@ class Player(Entity):
         self.hurt_time = None
         self.invulnerability_duration = 500
         
-        self.weapon_attack_sound = pygame.mixer.Sound('audio/sword.wav')
-        self.weapon_attack_sound.set_volume(0.4)
+        self.weapon_attack_sound = AssetRegistry.sound('audio/sword.wav', 0.4)
         
         # Unified input provider
         self.input_manager = input_manager
@@ -124,6 +124,9 @@ class Player(Entity):
             full_path = character_path + '/' + animation
             self.animations[animation] = import_folder(full_path)
         
+        # Transparent variants for the invulnerability flicker (shared blank surfaces)
+        self.flicker_animations = AssetRegistry.flicker_animations('player', self.animations)
+        
     def input(self):
         # Handle player input from keyboard or InputManager.
         if self.input_manager:
@@ -152,27 +155,26 @@ class Player(Entity):
             if 'attack' in self.status:
                 self.status = self.status.replace('_attack', '')
     
-    def cooldowns(self):
-        # Manage cooldown timers for attacks, switching, and invulnerability.
-        current_time = pygame.time.get_ticks()
-        
-        if self.attacking:
-            weapon_cooldown = weapon_data[self.weapon]['cooldown']
-            if current_time - self.attack_time >= self.attack_cooldown + weapon_cooldown:
-                self.attacking = False
-                self.destroy_attack()
-
-        if not self.can_switch_weapon:
-            if current_time - self.weapon_switch_time >= self.switch_duration_cooldown:
-                self.can_switch_weapon = True
-        
-        if not self.can_switch_magic:
-            if current_time - self.magic_switch_time >= self.switch_duration_cooldown:
-                self.can_switch_magic = True
-        
-        if not self.vulnerable:
-            if current_time - self.hurt_time >= self.invulnerability_duration:
-                self.vulnerable = True
+    # Cooldown expirations, fired by the level's timer service
+    def _end_attack(self):
+        self.attacking = False
+        self.destroy_attack()
+
+    def _enable_weapon_switch(self):
+        self.can_switch_weapon = True
+
+    def _enable_magic_switch(self):
+        self.can_switch_magic = True
+
+    def _restore_vulnerability(self):
+        self.vulnerable = True
+
+    def take_hit(self, amount):
+        # Apply damage and start the invulnerability window.
+        self.health -= amount
+        self.vulnerable = False
+        self.hurt_time = self.level.sim_time
+        self.set_timer(self.invulnerability_duration, self._restore_vulnerability)
    
     def animate(self):
         # Update animation frame and apply visual effects.
@@ -183,15 +185,13 @@ class Player(Entity):
         if self.frame_index >= len(animation):
             self.frame_index  = 0
             
-        self.image = animation[int(self.frame_index)]
-        self.rect = self.image.get_rect(center = self.hitbox.center)
-        
-        # Flicker effect during invulnerability
-        if not self.vulnerable:
-            alpha = self.wave_value()
-            self.image.set_alpha(alpha)
-        else:
-            self.image.set_alpha(255)
+        # Flicker effect during invulnerability (swap to the pre-baked frame)
+        frames = animation
+        if not self.vulnerable and self.wave_value() != 255:
+            animation = self.flicker_animations[self.status]
+            
+        frame = int(self.frame_index)
+        self.set_frame(animation[frame], frames, frame, center = self.hitbox.center)
         
     def get_full_weapon_damage(self):
         # Calculate total weapon damage including base attack stat.
@@ -301,13 +301,15 @@ class Player(Entity):
 
     def _start_weapon_attack(self):
         self.attacking = True 
-        self.attack_time = pygame.time.get_ticks()
+        self.attack_time = self.level.sim_time
+        self.set_timer(self.attack_cooldown + weapon_data[self.weapon]['cooldown'], self._end_attack)
         self.create_attack()
         self.weapon_attack_sound.play()
 
     def _start_magic_attack(self):
         self.attacking = True 
-        self.attack_time = pygame.time.get_ticks()
+        self.attack_time = self.level.sim_time
+        self.set_timer(self.attack_cooldown + weapon_data[self.weapon]['cooldown'], self._end_attack)
         style = list(magic_data.keys())[self.magic_index]
         strength = list(magic_data.values())[self.magic_index]["strength"]
         cost = list(magic_data.values())[self.magic_index]["cost"]
@@ -315,7 +317,8 @@ class Player(Entity):
 
     def _cycle_weapon(self):
         self.can_switch_weapon = False
-        self.weapon_switch_time = pygame.time.get_ticks()
+        self.weapon_switch_time = self.level.sim_time
+        self.set_timer(self.switch_duration_cooldown, self._enable_weapon_switch)
         if self.weapon_index < len(list(weapon_data.keys())) - 1:
             self.weapon_index += 1
         else: 
@@ -324,7 +327,8 @@ class Player(Entity):
 
     def _cycle_magic(self):
         self.can_switch_magic = False 
-        self.magic_switch_time = pygame.time.get_ticks()
+        self.magic_switch_time = self.level.sim_time
+        self.set_timer(self.switch_duration_cooldown, self._enable_magic_switch)
         if self.magic_index < len(list(magic_data.keys())) - 1:
             self.magic_index += 1
         else: 
@@ -385,7 +389,6 @@ class Player(Entity):
             self.input()
         else:
             self.direction.update(0, 0)
-        self.cooldowns()
         self.get_status()
         self.animate()
         if not knockback_active:
@@ -0,0 +1,176 @@
+"""
+Projectile System - Pooled, array-backed magic projectiles
+
+Purpose: Fire many flame projectiles without creating a Sprite per flame,
+adding it to the Y-sorted draw group and colliding it against every
+attackable sprite with spritecollide each frame.
+
+Data layout: a fixed number of slots, preallocated once
+- positions / velocities (x, y) in world pixels and pixels per step
+- ages and lifetimes in simulation steps
+- the animation (frame set) each slot plays
+- an active flag; free slots are recycled from a stack
+
+Per simulation step:
+1. Advance positions and ages of all active projectiles at once
+2. Retire expired projectiles back to the free stack
+3. Resolve hits: each live projectile asks the level for the attackable
+   sprites near its rect (spatial index lookups) and reports every overlap
+
+Projectiles are drawn as their own layer on top of the Y-sorted world, so
+they never enter the sprite groups.
+"""
+
+import numpy as np
+import pygame
+from settings import PROJECTILE_CAPACITY
+from support import blit_batch
+
+
+class ProjectileSystem:
+
+    def __init__(self, query_targets, on_hit, capacity=PROJECTILE_CAPACITY):
+        """
+        Args:
+            query_targets: callable(rect) -> attackable sprites overlapping rect
+            on_hit: callable(target_sprite, attack_type) run for every overlap
+            capacity: Maximum number of simultaneously live projectiles
+        """
+        self.query_targets = query_targets
+        self.on_hit = on_hit
+        self.capacity = capacity
+        self.animation_speed = 0.15
+
+        self.positions = np.zeros((capacity, 2), dtype=np.float64)
+        self.velocities = np.zeros((capacity, 2), dtype=np.float64)
+        self.ages = np.zeros(capacity, dtype=np.int32)
+        self.lifetimes = np.zeros(capacity, dtype=np.int32)
+        self.frame_set = np.zeros(capacity, dtype=np.int16)
+        self.active = np.zeros(capacity, dtype=bool)
+        self._free_slots = list(range(capacity - 1, -1, -1))
+
+        # Registered animations: id -> frames / hit size / attack type
+        self.frame_sets = []
+        self.frame_sizes = []
+        self.attack_types = []
+        self._frame_set_ids = {}
+
+        self.stats = {'spawned': 0, 'dropped': 0, 'peak_active': 0}
+
+    def register_frames(self, name, frames, attack_type='magic'):
+        # Make an animation available to spawn(); returns its id.
+        if name in self._frame_set_ids:
+            return self._frame_set_ids[name]
+        frame_set_id = len(self.frame_sets)
+        self.frame_sets.append(frames)
+        self.frame_sizes.append(frames.sizes[0])
+        self.attack_types.append(attack_type)
+        self._frame_set_ids[name] = frame_set_id
+        return frame_set_id
+
+    def spawn(self, name, pos, velocity=(0, 0), lifetime=None):
+        """
+        Launch a projectile from a free slot.
+
+        Args:
+            name: Registered animation name (e.g. 'flame')
+            pos: World position of the projectile center
+            velocity: Movement per simulation step
+            lifetime: Steps before it expires (defaults to one animation cycle)
+
+        Returns:
+            Slot index, or None if the pool is exhausted
+        """
+        if not self._free_slots:
+            self.stats['dropped'] += 1
+            return None
+
+        frame_set_id = self._frame_set_ids[name]
+        if lifetime is None:
+            lifetime = int(np.ceil(len(self.frame_sets[frame_set_id]) / self.animation_speed))
+
+        slot = self._free_slots.pop()
+        self.positions[slot] = pos
+        self.velocities[slot] = velocity
+        self.ages[slot] = 0
+        self.lifetimes[slot] = lifetime
+        self.frame_set[slot] = frame_set_id
+        self.active[slot] = True
+
+        self.stats['spawned'] += 1
+        live = self.capacity - len(self._free_slots)
+        if live > self.stats['peak_active']:
+            self.stats['peak_active'] = live
+        return slot
+
+    def clear(self):
+        self.active[:] = False
+        self._free_slots = list(range(self.capacity - 1, -1, -1))
+
+    def __len__(self):
+        return self.capacity - len(self._free_slots)
+
+    def _rect(self, slot):
+        width, height = self.frame_sizes[self.frame_set[slot]]
+        rect = pygame.Rect(0, 0, width, height)
+        rect.center = (round(self.positions[slot, 0]), round(self.positions[slot, 1]))
+        return rect
+
+    def update(self):
+        # Advance every live projectile by one simulation step and resolve hits.
+        live = np.flatnonzero(self.active)
+        if len(live) == 0:
+            return
+
+        # 1. Move and age all projectiles at once
+        self.positions[live] += self.velocities[live]
+        self.ages[live] += 1
+
+        # 2. Retire expired projectiles
+        expired = live[self.ages[live] >= self.lifetimes[live]]
+        if len(expired):
+            self.active[expired] = False
+            self._free_slots.extend(expired.tolist())
+            live = np.flatnonzero(self.active)
+
+        # 3. Hits via the level's spatial indexes
+        for slot in live.tolist():
+            rect = self._rect(slot)
+            attack_type = self.attack_types[self.frame_set[slot]]
+            for target in self.query_targets(rect):
+                self.on_hit(target, attack_type)
+
+    def draw(self, surface, offset, alpha=1.0):
+        """
+        Draw live projectiles as an overlay layer.
+
+        Args:
+            surface: Target surface
+            offset: Camera offset (Vector2)
+            alpha: Interpolation factor between the previous and current step
+        """
+        live = np.flatnonzero(self.active)
+        if len(live) == 0:
+            return
+
+        # Interpolate back towards the previous step position
+        positions = self.positions[live] - self.velocities[live] * (1.0 - alpha)
+        positions -= (offset.x, offset.y)
+        frame_indices = (self.ages[live] * self.animation_speed).astype(np.int32)
+
+        blit_sequence = []
+        for slot, x, y, frame_index in zip(live.tolist(), positions[:, 0].tolist(),
+                                           positions[:, 1].tolist(), frame_indices.tolist()):
+            frames = self.frame_sets[self.frame_set[slot]]
+            frame = min(frame_index, len(frames) - 1)
+            width, height = frames.sizes[frame]
+            offset_x, offset_y = frames.offsets[frame]
+            blit_sequence.append((frames[frame], (round(x) - width // 2 + offset_x,
+                                                  round(y) - height // 2 + offset_y)))
+        blit_batch(surface, blit_sequence)
+
+    def get_stats(self):
+        stats = self.stats.copy()
+        stats['active'] = len(self)
+        stats['capacity'] = self.capacity
+        return stats
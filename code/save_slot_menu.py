@@ -14,11 +14,16 @@ class SaveSlotMenu:
         self.max_slots = 5
         self.visible = False
         self.is_save_mode = True  # Track whether we're in save or load mode
+        self.slot_width = 400
+        self.slot_height = 70
+        self.save_infos = [None] * self.max_slots  # Read from disk when the menu opens
+        self.overlay = None
         
     def show(self):
         # Show the save slot selection menu.
         self.visible = True
         self.selected_slot = 0
+        self.save_infos = [self.save_manager.get_save_info(i) for i in range(self.max_slots)]
         
     def hide(self):
         # Hide the save slot selection menu.
@@ -28,6 +33,17 @@ class SaveSlotMenu:
         # Set whether the menu is in save or load mode.
         self.is_save_mode = is_save_mode
         
+    def slot_rect(self, index: int) -> pygame.Rect:
+        # Screen area of one slot button.
+        start_y = 200
+        spacing = 20
+        return pygame.Rect(
+            (self.screen.get_width() - self.slot_width) // 2,
+            start_y + index * (self.slot_height + spacing),
+            self.slot_width,
+            self.slot_height
+        )
+        
     def handle_event(self, event: pygame.event.Event) -> bool:
         # Handle input events for the save slot menu.
         if not self.visible:
@@ -76,9 +92,10 @@ class SaveSlotMenu:
             return
             
         # Semi-transparent background
-        s = pygame.Surface(self.screen.get_size(), pygame.SRCALPHA)
-        s.fill((0, 0, 0, 180))  # Black with alpha
-        self.screen.blit(s, (0, 0))
+        if self.overlay is None or self.overlay.get_size() != self.screen.get_size():
+            self.overlay = pygame.Surface(self.screen.get_size(), pygame.SRCALPHA)
+            self.overlay.fill((0, 0, 0, 180))  # Black with alpha
+        self.screen.blit(self.overlay, (0, 0))
         
         # Title
         title_text = "Select Save Slot" if self.is_save_mode else "Select Load Slot"
@@ -87,19 +104,9 @@ class SaveSlotMenu:
         self.screen.blit(title, title_rect)
         
         # Draw slots
-        slot_width = 400
-        slot_height = 70
-        start_y = 200
-        spacing = 20
-        
         for i in range(self.max_slots):
             # Position and size of the slot
-            rect = pygame.Rect(
-                (self.screen.get_width() - slot_width) // 2,
-                start_y + i * (slot_height + spacing),
-                slot_width,
-                slot_height
-            )
+            rect = self.slot_rect(i)
             
             # Highlight selected slot
             if i == self.selected_slot:
@@ -116,7 +123,7 @@ class SaveSlotMenu:
             self.screen.blit(text_surf, text_rect)
             
             # Save info if exists
-            save_info = self.save_manager.get_save_info(i)
+            save_info = self.save_infos[i]
             if save_info and 'timestamp' in save_info:
                 # Format date
                 try:
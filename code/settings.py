@@ -2,6 +2,9 @@
 WIDTH = 1280
 HEIGTH = 720
 FPS = 60
+IDLE_WAIT_MS = 500  # Longest the loop blocks for input on static screens (menus, death, game complete)
+SIMULATION_STEP_MS = 1000 / 60  # Fixed simulation timestep (gameplay tuned for 60 steps/s)
+MAX_CATCH_UP_STEPS = 5  # Max simulation steps per rendered frame before dropping time
 TILESIZE = 64
 
 # Hitbox adjustments for different sprite types
@@ -20,6 +23,7 @@ ITEM_BOX_SIZE = 80
 UI_FONT = 'graphics/font/joystix.ttf'
 UI_FONT_SIZE = 18
 UI_FONT_SIZE_LARGE = 32
+UI_TEXT_CACHE_SIZE = 64  # Rendered HUD strings kept for reuse (oldest dropped first)
 
 # Color palette
 WATER_COLOR = '#71ddee'
@@ -36,6 +40,52 @@ BAR_COLOR = '#EEEEEE'
 BAR_COLOR_SELECTED = '#111111'
 UPGRADE_BG_COLOR_SELECTED = '#EEEEEE'
 
+# Enemy simulation level of detail
+LOD_ACTIVATION_MARGIN = TILESIZE * 6  # Off-screen band where enemies still update at a reduced rate
+LOD_REDUCED_INTERVAL = 4  # Frames between updates for enemies in the reduced tier
+
+# Arena mode (endless enemy waves from pooled enemies)
+ARENA_MODE = False
+ARENA_POOL_SIZE = {'eye': 40, 'raccoon': 20, 'squirrel': 40, 'owl': 40}  # Pre-warmed instances per type
+ARENA_SPAWN_INTERVAL = 250  # ms between spawns within a wave
+ARENA_WAVE_BREAK = 5000  # ms between a cleared wave and the next one
+ARENA_FIRST_WAVE_SIZE = 10
+ARENA_WAVE_GROWTH = 5  # Extra enemies per wave
+ARENA_MAX_ACTIVE = 150  # Cap on simultaneously alive enemies
+
+# World rendering
+STATIC_CHUNK_SIZE = 512  # Size in pixels of the baked chunks holding grass and objects
+FLOOR_TILE_SIZE = 512  # Size in pixels of the streamed floor tiles
+FLOOR_MEMORY_BUDGET = 64 * 1024 * 1024  # Bytes of floor tiles kept in memory
+FLOOR_PREFETCH_PER_FRAME = 1  # Tiles loaded ahead of the camera per frame
+
+# Frame folders under these roots are packed, trimmed, into one atlas sheet per category
+ATLAS_CATEGORIES = {
+    'player': 'graphics/player',
+    'monsters': 'graphics/monsters',
+    'particles': 'graphics/particles'
+}
+ATLAS_SHEET_WIDTH = 2048  # Width in pixels of an atlas sheet (height grows to fit)
+
+# Internal render resolution for the world, e.g. (1920, 1080); None renders at the
+# display resolution. The world is upscaled once per frame to the display.
+RENDER_RESOLUTION = None
+RENDER_SMOOTH_SCALE = False  # smoothscale instead of nearest-neighbour scale when upscaling
+RENDER_UI_NATIVE = True  # Draw the HUD at display resolution on top of the upscaled world
+
+# Generated data (floor tiles etc.), safe to delete
+CACHE_DIR = 'cache'
+
+# Background asset loading (level start)
+ASSET_LOADER_WORKERS = 4  # Threads reading and decoding files
+ASSET_LOADER_FRAME_BUDGET_MS = 8  # Main-thread time per frame spent converting and registering loaded assets
+
+# Magic projectiles
+PROJECTILE_CAPACITY = 256  # Preallocated projectile slots (spawns beyond this are dropped)
+
+# Particle effects
+PARTICLE_CAPACITY = 512  # Preallocated particle slots (spawns beyond this are dropped)
+
 # Debug mode
 DEBUG_MODE = False 
 
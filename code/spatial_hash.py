@@ -37,7 +37,7 @@ class SpatialHashGrid:
         - With spatial hash: ~5-10 checks per query = O(n) total
     """
     
-    def __init__(self, cell_size=TILESIZE * 2):
+    def __init__(self, cell_size=TILESIZE * 2, bounds='hitbox'):
         """
         Initialize spatial hash grid.
         
@@ -45,13 +45,18 @@ class SpatialHashGrid:
             cell_size: Size of each grid cell in pixels (default: 3 tiles = 192px)
                       Larger cells = fewer cells but more entities per cell
                       Smaller cells = more cells but fewer entities per cell
+            bounds: Name of the sprite Rect attribute that is hashed
+                    ('hitbox' for collision, 'rect' for drawing)
                       
         Design choice: 3 tiles is optimal for typical enemy/player sizes
         - Too small: entities span many cells, overhead increases
         - Too large: too many entities per cell, less optimization
         """
         self.cell_size = cell_size
+        self.bounds = bounds
         self.grid = {}  # Dictionary mapping (cell_x, cell_y) -> [sprite list]
+        self._sprite_cells = {}  # Dictionary mapping sprite -> cells it occupies
+        self.version = 0  # Bumped on every structural change (lets callers cache queries)
         
         # Statistics for debugging/optimization
         self.stats = {
@@ -104,6 +109,15 @@ class SpatialHashGrid:
         
         return cells
     
+    def cell_range(self, rect):
+        """
+        Return the (min_cell, max_cell) corners covered by a rectangle.
+        
+        Two rects with the same cell range produce the same query() result,
+        so this works as a cache key for repeated queries.
+        """
+        return (self._hash(rect.left, rect.top), self._hash(rect.right - 1, rect.bottom - 1))
+    
     def clear(self):
         """
         Clear all sprites from the grid. 
@@ -112,6 +126,8 @@ class SpatialHashGrid:
         The grid is rebuilt every frame because sprites move.
         """
         self.grid.clear()
+        self._sprite_cells.clear()
+        self.version += 1
         self.stats['queries_this_frame'] = 0
     
     def insert(self, sprite):
@@ -126,29 +142,81 @@ class SpatialHashGrid:
         Time Complexity: O(k) where k = cells sprite spans (usually 1-4)
         
         Args:
-            sprite: Any sprite with a 'hitbox' attribute (Rect)
+            sprite: Any sprite with a 'hitbox' attribute (Rect), or the
+                    attribute named by bounds
         """
         # Skip sprites without hitbox
-        if not hasattr(sprite, 'hitbox'):
+        bounds = getattr(sprite, self.bounds, None)
+        if bounds is None:
             return
         
+        # Re-inserting a tracked sprite moves it instead of duplicating it
+        if sprite in self._sprite_cells:
+            self.remove(sprite)
+        
         # Get all cells this sprite overlaps
-        cells = self._get_cells_for_rect(sprite.hitbox)
+        cells = self._get_cells_for_rect(bounds)
+        self._sprite_cells[sprite] = cells
         
         # Add sprite to each cell
         for cell in cells:
             if cell not in self.grid:
                 self.grid[cell] = []
-            self.grid[cell].append(sprite)
+            cell_sprites = self.grid[cell]
+            cell_sprites.append(sprite)
+            
+            # Track max sprites per cell for optimization analysis
+            if len(cell_sprites) > self.stats['max_sprites_per_cell']:
+                self.stats['max_sprites_per_cell'] = len(cell_sprites)
         
         # Update statistics
+        self.version += 1
         self.stats['total_sprites'] += 1
         self.stats['total_cells'] = len(self.grid)
+    
+    def remove(self, sprite):
+        """
+        Remove a sprite from every cell it was inserted into.
         
-        # Track max sprites per cell for optimization analysis
-        for cell_sprites in self.grid.values():
-            if len(cell_sprites) > self.stats['max_sprites_per_cell']:
-                self.stats['max_sprites_per_cell'] = len(cell_sprites)
+        Lets long-lived grids (entities that are not rebuilt every frame)
+        drop sprites that died or went out of scope.
+        
+        Time Complexity: O(k * m) where k = cells the sprite spans
+        """
+        cells = self._sprite_cells.pop(sprite, None)
+        if cells is None:
+            return
+        
+        for cell in cells:
+            cell_sprites = self.grid.get(cell)
+            if cell_sprites is None:
+                continue
+            cell_sprites.remove(sprite)
+            if not cell_sprites:
+                del self.grid[cell]
+        
+        self.version += 1
+        self.stats['total_sprites'] -= 1
+        self.stats['total_cells'] = len(self.grid)
+    
+    def move(self, sprite):
+        """
+        Re-hash a sprite after its hitbox moved.
+        
+        Incremental alternative to clear() + insert() for grids holding
+        moving entities: the sprite is only re-bucketed when it actually
+        crossed a cell boundary, which is rare for small per-frame moves.
+        """
+        cells = self._get_cells_for_rect(getattr(sprite, self.bounds))
+        if self._sprite_cells.get(sprite) == cells:
+            return
+        self.insert(sprite)
+    
+    def __contains__(self, sprite):
+        return sprite in self._sprite_cells
+    
+    def __len__(self):
+        return len(self._sprite_cells)
     
     def query(self, rect):
         """
@@ -1,5 +1,6 @@
 import pygame
 from settings import UI_FONT, UI_FONT_SIZE, TEXT_COLOR, UI_BG_COLOR, UI_BORDER_COLOR, UI_BORDER_COLOR_ACTIVE, UI_FONT_SIZE_LARGE
+from support import load_image
 
 class StartScreen:
     def __init__(self, display_surface):
@@ -13,7 +14,7 @@ class StartScreen:
         self.option_rects = []
         
         # Load and scale the portrait image
-        original_portrait = pygame.image.load('graphics/menu/portrait.jpg').convert_alpha()
+        original_portrait = load_image('graphics/menu/portrait.jpg')
         
         # Calculate scaling to fit nicely in the window (e.g., 40% of screen height)
         target_height = int(self.screen_height * 0.4)
@@ -28,11 +29,17 @@ class StartScreen:
         self.title_surf = self.title_font.render('AETHERBOUND', True, TEXT_COLOR)
         self.title_rect = self.title_surf.get_rect(center=(self.screen_width//2, self.screen_height//6))
         
+        # Dim background, built once
+        self.overlay = pygame.Surface(self.display_surface.get_size())
+        self.overlay.set_alpha(180)
+        self.overlay.fill((0, 0, 0))
+        
         # Create menu options
         self._create_menu_options()
         
     def _create_menu_options(self):
         self.option_rects = []
+        self.option_surfs = []
         option_height = 60
         start_y = self.screen_height // 2 + 50
         
@@ -41,13 +48,11 @@ class StartScreen:
             rect = pygame.Rect(0, 0, 300, 50)
             rect.center = (self.screen_width//2, start_y + i * (option_height + 20))
             self.option_rects.append(rect)
+            self.option_surfs.append(self.font.render(option, True, TEXT_COLOR))
     
     def draw(self):
         # Dim background
-        overlay = pygame.Surface(self.display_surface.get_size())
-        overlay.set_alpha(180)
-        overlay.fill((0, 0, 0))
-        self.display_surface.blit(overlay, (0, 0))
+        self.display_surface.blit(self.overlay, (0, 0))
         
         # Draw title
         self.display_surface.blit(self.title_surf, self.title_rect)
@@ -56,7 +61,7 @@ class StartScreen:
         self.display_surface.blit(self.portrait_img, self.portrait_rect)
         
         # Draw menu options
-        for i, (option, rect) in enumerate(zip(self.menu_options, self.option_rects)):
+        for i, (text_surf, rect) in enumerate(zip(self.option_surfs, self.option_rects)):
             # Draw button background
             bg_color = UI_BORDER_COLOR_ACTIVE if i == self.selected_index else UI_BG_COLOR
             border_color = UI_BORDER_COLOR_ACTIVE
@@ -65,7 +70,6 @@ class StartScreen:
             pygame.draw.rect(self.display_surface, border_color, rect, 3, border_radius=10)
             
             # Draw option text
-            text_surf = self.font.render(option, True, TEXT_COLOR)
             text_rect = text_surf.get_rect(center=rect.center)
             self.display_surface.blit(text_surf, text_rect)
     
@@ -0,0 +1,146 @@
+"""
+Static Layer - Baked chunks of map tiles
+
+Purpose: Draw grass and objects with a few large blits instead of one blit
+per tile, without losing Y-sorting against entities.
+
+Algorithm:
+1. Tiles are bucketed into square chunks (STATIC_CHUNK_SIZE) by rect center
+2. A chunk is baked lazily, the first time it is visible:
+   - tiles sharing the same rect.centery form one depth band, because the
+     Y-sort can never place an entity between them
+   - each band is split into horizontal runs of touching tiles so no
+     transparent gaps are baked (large empty areas would cost fill-rate)
+   - every run is composited once into its own surface (a StaticBand)
+3. Removing a tile (grass being cut) drops the chunk's baked bands; they are
+   rebuilt the next time the chunk is drawn
+
+Bands are returned as (centery, sequence, band) entries sorted per chunk, the
+same shape the camera group uses for sprites, so they merge into its draw order.
+"""
+
+import pygame
+from bisect import bisect_left, insort
+from settings import STATIC_CHUNK_SIZE
+
+
+class StaticBand:
+    # Baked run of static tiles drawn as one sprite-like image.
+    __slots__ = ('image', 'rect')
+    image_offset = (0, 0)
+
+    def __init__(self, sprites):
+        self.rect = sprites[0].rect.unionall([sprite.rect for sprite in sprites[1:]])
+        self.image = pygame.Surface(self.rect.size, pygame.SRCALPHA).convert_alpha()
+        for sprite in sprites:
+            self.image.blit(sprite.image, (sprite.rect.x - self.rect.x, sprite.rect.y - self.rect.y))
+
+
+class StaticChunkLayer:
+
+    def __init__(self, chunk_size=STATIC_CHUNK_SIZE):
+        self.chunk_size = chunk_size
+        self.chunks = {}          # (chunk_x, chunk_y) -> sorted [(centery, sequence, sprite)]
+        self._sprite_chunks = {}  # sprite -> (chunk key, entry)
+        self._bands = {}          # chunk key -> sorted [(centery, sequence, band)]
+        self.extent = [0, 0]      # Largest tile (width, height), widens chunk lookups
+
+        self.stats = {'bakes': 0, 'bands': 0}
+
+    def add(self, sprite, sequence):
+        # Register a static tile; sequence breaks Y-sort ties like insertion order.
+        rect = sprite.rect
+        key = (rect.centerx // self.chunk_size, rect.centery // self.chunk_size)
+        entry = (rect.centery, sequence, sprite)
+        insort(self.chunks.setdefault(key, []), entry)
+        self._sprite_chunks[sprite] = (key, entry)
+        self._bands.pop(key, None)
+
+        self.extent[0] = max(self.extent[0], rect.width)
+        self.extent[1] = max(self.extent[1], rect.height)
+
+    def remove(self, sprite):
+        # Drop a tile and invalidate its chunk.
+        chunk = self._sprite_chunks.pop(sprite, None)
+        if chunk is None:
+            return
+        key, entry = chunk
+        entries = self.chunks[key]
+        del entries[bisect_left(entries, entry)]
+        self._bands.pop(key, None)
+
+    def __contains__(self, sprite):
+        return sprite in self._sprite_chunks
+
+    def _bake(self, key):
+        # Composite a chunk into one band entry per run of same-depth tiles.
+        bands = []
+        entries = self.chunks.get(key, [])
+        start = 0
+        while start < len(entries):
+            centery = entries[start][0]
+            end = start
+            while end < len(entries) and entries[end][0] == centery:
+                end += 1
+
+            # Split the depth band into runs of horizontally touching tiles
+            row = sorted(entries[start:end], key=lambda entry: entry[2].rect.left)
+            run = [row[0]]
+            run_right = row[0][2].rect.right
+            for entry in row[1:]:
+                rect = entry[2].rect
+                if rect.left > run_right:
+                    bands.append(self._make_band(run))
+                    run = []
+                    run_right = rect.right
+                run.append(entry)
+                run_right = max(run_right, rect.right)
+            bands.append(self._make_band(run))
+            start = end
+
+        bands.sort()
+        self._bands[key] = bands
+        self.stats['bakes'] += 1
+        self.stats['bands'] = sum(len(chunk_bands) for chunk_bands in self._bands.values())
+        return bands
+
+    def _make_band(self, run):
+        # Blit order inside a band follows insertion order, as the sprite draw did.
+        run.sort(key=lambda entry: entry[1])
+        return (run[0][0], run[0][1], StaticBand([entry[2] for entry in run]))
+
+    def visible(self, query_rect):
+        """
+        Baked bands overlapping query_rect.
+
+        Returns:
+            List of per-chunk lists of (centery, sequence, band), each sorted
+        """
+        half_width = self.extent[0] // 2
+        half_height = self.extent[1] // 2
+        first_x = (query_rect.left - half_width) // self.chunk_size
+        last_x = (query_rect.right + half_width) // self.chunk_size
+        first_y = (query_rect.top - half_height) // self.chunk_size
+        last_y = (query_rect.bottom + half_height) // self.chunk_size
+
+        slices = []
+        for chunk_y in range(first_y, last_y + 1):
+            for chunk_x in range(first_x, last_x + 1):
+                key = (chunk_x, chunk_y)
+                if not self.chunks.get(key):
+                    continue
+                bands = self._bands.get(key)
+                if bands is None:
+                    bands = self._bake(key)
+                entries = [entry for entry in bands if entry[2].rect.colliderect(query_rect)]
+                if entries:
+                    slices.append(entries)
+        return slices
+
+    def get_stats(self):
+        return {
+            'chunks': len(self.chunks),
+            'baked_chunks': len(self._bands),
+            'bands': self.stats['bands'],
+            'bakes': self.stats['bakes']
+        }
@@ -0,0 +1,105 @@
+"""
+Obstacle Field - Precomputed wall normals for cheap steering
+
+Purpose: Let an entity that is about to walk into a wall pick a slide
+direction with a single table lookup, instead of probing several rotated
+directions with trig, Rect copies and extra spatial-grid queries.
+
+Algorithm:
+1. For every tile, sum the offsets pointing away from blocked neighbours
+   (8-neighbourhood, map edges count as blocked) and normalise the result.
+   Blocked tiles get the normal pointing towards their walkable neighbours,
+   so entities clipping into an obstacle tile are still pushed out.
+2. At runtime, remove the component of the movement direction that points
+   into the wall: slide = d - min(0, d . n) * n
+3. If nothing is left (walking straight into the wall), follow the wall
+   tangent instead.
+
+Normals are recomputed locally when a tile changes (e.g. grass is cut).
+"""
+
+import pygame
+from settings import TILESIZE
+
+_NEIGHBOURS = [(-1, -1), (0, -1), (1, -1), (-1, 0), (1, 0), (-1, 1), (0, 1), (1, 1)]
+
+
+class ObstacleField:
+
+    def __init__(self, walkable_grid):
+        """
+        Args:
+            walkable_grid: 2D list indexed [row][col], True where the tile is free
+                           (the level's pathfinding grid, shared by reference)
+        """
+        self.grid = walkable_grid
+        self.rows = len(walkable_grid)
+        self.cols = len(walkable_grid[0]) if walkable_grid else 0
+        self.normals = [[None] * self.cols for _ in range(self.rows)]
+
+        for row in range(self.rows):
+            for col in range(self.cols):
+                self._compute_normal(col, row)
+
+    def _is_walkable(self, col, row):
+        return 0 <= row < self.rows and 0 <= col < self.cols and self.grid[row][col]
+
+    def _compute_normal(self, col, row):
+        # Average direction pointing from blocked space towards free space.
+        walkable = self._is_walkable(col, row)
+        nx = ny = 0
+        for dx, dy in _NEIGHBOURS:
+            if self._is_walkable(col + dx, row + dy) != walkable:
+                if walkable:
+                    nx -= dx
+                    ny -= dy
+                else:
+                    nx += dx
+                    ny += dy
+
+        length = (nx * nx + ny * ny) ** 0.5
+        self.normals[row][col] = (nx / length, ny / length) if length else None
+
+    def update_cell(self, col, row):
+        # Refresh normals around a tile whose walkability changed.
+        for dx, dy in [(0, 0)] + _NEIGHBOURS:
+            c, r = col + dx, row + dy
+            if 0 <= r < self.rows and 0 <= c < self.cols:
+                self._compute_normal(c, r)
+
+    def normal_at(self, pos):
+        # Wall normal for the tile containing a world position (None in open space).
+        col = int(pos[0] // TILESIZE)
+        row = int(pos[1] // TILESIZE)
+        if 0 <= row < self.rows and 0 <= col < self.cols:
+            return self.normals[row][col]
+        return None
+
+    def slide_direction(self, pos, direction):
+        """
+        Return a unit direction that slides along the nearest wall.
+
+        Args:
+            pos: World position of the entity (usually hitbox center)
+            direction: Desired normalized movement direction (Vector2)
+
+        Returns:
+            Vector2 slide direction, or None if no wall normal is known here
+        """
+        normal = self.normal_at(pos)
+        if normal is None:
+            return None
+
+        nx, ny = normal
+        dot = direction.x * nx + direction.y * ny
+        if dot >= 0:
+            # Already moving away from the wall; the blocker is something else
+            return None
+
+        slide_x = direction.x - dot * nx
+        slide_y = direction.y - dot * ny
+        length = (slide_x * slide_x + slide_y * slide_y) ** 0.5
+        if length < 1e-3:
+            # Head-on: follow the wall tangent
+            return pygame.math.Vector2(-ny, nx)
+        return pygame.math.Vector2(slide_x / length, slide_y / length)
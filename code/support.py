@@ -1,8 +1,23 @@
 from csv import reader
 from os import walk
 import pygame
+from atlas import FrameList, atlas_frames
+from pixel_cache import load_image
+
+_preloaded_layouts = {}  # path -> layout parsed ahead of time by the AssetLoader
+
+def preload_csv_layout(path, layout):
+    # Keep a parsed layout for the next import_csv_layout(path).
+    _preloaded_layouts[path] = layout
 
 def import_csv_layout(path):
+    # Return the 2D tile layout of a CSV file (preloaded or read now).
+    layout = _preloaded_layouts.pop(path, None)
+    if layout is not None:
+        return layout
+    return read_csv_layout(path)
+
+def read_csv_layout(path):
     # Load CSV file and return 2D list representing tile layout.
     terrain_map = []
     
@@ -15,13 +30,34 @@ def import_csv_layout(path):
         return terrain_map
 
 def import_folder(path):
-    # Load all images from folder and return list of surfaces.
-    surface_list = []
+    # Load all images from folder and return a FrameList of surfaces.
+    # Folders under an atlas category come trimmed from the packed sheet.
+    frames = atlas_frames(path)
+    if frames is not None:
+        return FrameList(frames, list(frames.offsets), list(frames.sizes))
+    
+    surface_list = FrameList()
     
     for _, __, img_files in walk(path):
         for image in img_files:
             full_path = path + '/' + image
-            image_surf = pygame.image.load(full_path).convert_alpha()
+            image_surf = load_image(full_path)
             surface_list.append(image_surf)
+            surface_list.offsets.append((0, 0))
+            surface_list.sizes.append(image_surf.get_size())
     
-    return surface_list
\ No newline at end of file
+    return surface_list
+
+def blit_batch(surface, blit_sequence):
+    # Blit a list of (source, (x, y)) pairs in as few Python calls as possible.
+    if _fblits is not None:
+        _fblits(surface, blit_sequence)
+    elif _blits is not None:
+        _blits(surface, blit_sequence, False)
+    else:
+        for source, dest in blit_sequence:
+            surface.blit(source, dest)
+
+# Surface.fblits only exists in pygame-ce; Surface.blits needs pygame >= 1.9.4
+_fblits = getattr(pygame.Surface, 'fblits', None)
+_blits = getattr(pygame.Surface, 'blits', None)
@@ -0,0 +1,76 @@
+"""
+Timer Service - Event-driven cooldowns
+
+Purpose: Replace per-frame polling of pygame.time.get_ticks() in every entity
+(attack cooldowns, invulnerability windows, switch delays) with one central
+min-heap of expirations.
+
+Algorithm: Binary heap keyed by due time
+- schedule() pushes (due, sequence, timer) - O(log n)
+- update() pops only the timers that are due and runs their callbacks
+- cancel() marks a timer inactive; it is discarded lazily when popped
+
+Per-frame cost is one heap peek plus the timers that actually fire, so idle
+entities cost nothing.
+
+Times are milliseconds on the clock the caller passes as now; the Level passes
+its simulation clock, so cooldowns stretch with the simulation when it falls
+behind. Without now, pygame.time.get_ticks() is used.
+"""
+
+import heapq
+from itertools import count
+import pygame
+
+
+class Timer:
+    # Handle returned by TimerService.schedule (pass it to cancel()).
+    __slots__ = ('due', 'callback', 'active')
+
+    def __init__(self, due, callback):
+        self.due = due
+        self.callback = callback
+        self.active = True
+
+
+class TimerService:
+
+    def __init__(self):
+        self._heap = []
+        self._sequence = count()  # Tie-breaker so equal due times fire in schedule order
+
+    def schedule(self, delay, callback, now=None):
+        """
+        Run callback once, delay milliseconds from now.
+
+        Returns:
+            Timer handle that can be cancelled
+        """
+        if now is None:
+            now = pygame.time.get_ticks()
+        timer = Timer(now + delay, callback)
+        heapq.heappush(self._heap, (timer.due, next(self._sequence), timer))
+        return timer
+
+    def cancel(self, timer):
+        # Prevent a scheduled callback from running (safe to call with None).
+        if timer is not None:
+            timer.active = False
+
+    def update(self, now=None):
+        # Fire every timer that is due.
+        if now is None:
+            now = pygame.time.get_ticks()
+
+        heap = self._heap
+        while heap and heap[0][0] <= now:
+            _, _, timer = heapq.heappop(heap)
+            if timer.active:
+                timer.active = False
+                timer.callback()
+
+    def clear(self):
+        self._heap.clear()
+
+    def __len__(self):
+        return len(self._heap)
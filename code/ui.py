@@ -1,130 +1,218 @@
 import pygame
 from settings import *
+from support import blit_batch, load_image
+from asset_registry import AssetRegistry
 
 class UI:
+    """
+    Heads-up display (bars, EXP counter, weapon/magic boxes).
     
-    def __init__(self, input_manager=None):
-        self.display_surface = pygame.display.get_surface()
+    The HUD is composited into a transparent layer in three parts (bars, item
+    boxes, EXP box), each redrawn only when something it shows changes.
+    - Static pieces are baked once: bar and item box frames, and the box
+      labels for each input scheme
+    - Dynamic pieces are drawn over them on change: bar fills (pixel widths),
+      selected items, switch highlights and the EXP number
+    - Text is rendered through a small (text, color) cache, so an EXP value
+      or label the HUD showed before is reused instead of re-rendered
+    Every frame the parts' regions of the layer are blitted in one call.
+    """
+    
+    def __init__(self, input_manager=None, surface=None):
+        self.display_surface = surface if surface is not None else pygame.display.get_surface()
         self.font = pygame.font.Font(UI_FONT, UI_FONT_SIZE)
         self.input_manager = input_manager
         
+        # Composited HUD layer: per part, the key it was drawn for and its region
+        self.screen_size = self.display_surface.get_size()
+        self.layer = pygame.Surface(self.screen_size, pygame.SRCALPHA)
+        self._part_keys = {}
+        self._part_rects = {}
+        self._layer_blits = []
+        self._scheme = None
+        self._labels = {}  # scheme -> baked label surfaces
+        self._text_cache = {}  # (text, color, antialias) -> rendered text, bounded by UI_TEXT_CACHE_SIZE
+        
         # Health and energy bar positions
         self.health_bar_rect = pygame.Rect(10, 10, HEALTH_BAR_WIDTH, BAR_HEIGHT)
         self.energy_bar_rect = pygame.Rect(10, 34, ENERGY_BAR_WIDTH, BAR_HEIGHT)
         
-        # Load weapon graphics
-        self.weapon_graphics = []
-        for weapon in weapon_data.values(): 
-            path = weapon['graphic']
-            weapon = pygame.image.load(path).convert_alpha()
-            self.weapon_graphics.append(weapon)
-
+        # Item box positions (the magic box overlaps the weapon box and is drawn after it)
+        self.weapon_box_rect = pygame.Rect(10, 630, ITEM_BOX_SIZE, ITEM_BOX_SIZE)
+        self.magic_box_rect = pygame.Rect(80, 635, ITEM_BOX_SIZE, ITEM_BOX_SIZE)
+        
+        # Baked frames: bar backgrounds (their border is the background color) and item boxes
+        self.bar_frames = {}
+        for bg_rect in (self.health_bar_rect, self.energy_bar_rect):
+            frame = pygame.Surface(bg_rect.size)
+            frame.fill(UI_BG_COLOR)
+            self.bar_frames[bg_rect.size] = frame
+        self.box_frames = {}
+        for has_switched, border_color in ((False, UI_BORDER_COLOR), (True, UI_BORDER_COLOR_ACTIVE)):
+            frame = pygame.Surface((ITEM_BOX_SIZE, ITEM_BOX_SIZE))
+            frame.fill(UI_BG_COLOR)
+            pygame.draw.rect(frame, border_color, frame.get_rect(), 3)
+            self.box_frames[has_switched] = frame
+        
+        # Weapon graphics (shared with the weapon sprites)
+        self.weapon_graphics = [AssetRegistry.weapon_images(weapon)['full'] for weapon in weapon_data]
+        
         # Load magic graphics
         self.magic_graphics = []
         for magic in magic_data.values(): 
             path = magic['graphic']
             print(path)
-            magic = pygame.image.load(path).convert_alpha()
+            magic = load_image(path)
             self.magic_graphics.append(magic)
     
+    def _render_text(self, text, color, antialias=True):
+        # Rendered text from the cache, rendering (and evicting the oldest entry) on a miss.
+        key = (text, color, antialias)
+        text_surf = self._text_cache.get(key)
+        if text_surf is None:
+            if len(self._text_cache) >= UI_TEXT_CACHE_SIZE:
+                del self._text_cache[next(iter(self._text_cache))]
+            text_surf = self.font.render(text, antialias, color)
+            self._text_cache[key] = text_surf
+        return text_surf
+    
+    def _bake_label(self, text):
+        # Label text on its background plate, as one opaque surface.
+        text_surf = self._render_text(text, TEXT_COLOR)
+        plate = pygame.Surface(text_surf.get_rect().inflate(8, 4).size)
+        plate.fill(UI_BG_COLOR)
+        plate.blit(text_surf, (4, 2))
+        return plate
+    
+    def _scheme_labels(self, scheme):
+        # Baked weapon, magic and EXP labels for an input scheme.
+        labels = self._labels.get(scheme)
+        if labels is None:
+            labels = {
+                'weapon': self._bake_label(self._weapon_label_for_scheme(scheme)),
+                'magic': self._bake_label(self._magic_label_for_scheme(scheme)),
+                'exp': self._bake_label(self._exp_label_for_scheme(scheme))
+            }
+            self._labels[scheme] = labels
+        return labels
+    
+    @staticmethod
+    def _bar_width(current, max_amount, bg_rect):
+        # Pixel width of a bar's fill (what actually changes on screen), rounded like Rect does.
+        fill_rect = bg_rect.copy()
+        fill_rect.width = bg_rect.width * (current / max_amount)
+        return fill_rect.width
+    
     def show_bar(self, current, max_amount, bg_rect, color):
-        # Draw stat bar with background and border.
-        pygame.draw.rect(self.display_surface, UI_BG_COLOR, bg_rect)
+        # Draw stat bar: baked background, then the fill inside the 3 px border.
+        self.layer.blit(self.bar_frames[bg_rect.size], bg_rect)
         
         # Calculate bar width based on current stat percentage
-        ratio = current / max_amount
-        current_width = bg_rect.width * ratio
         current_rect = bg_rect.copy()
-        current_rect.width = current_width
-        
-        pygame.draw.rect(self.display_surface, color, current_rect)
-        pygame.draw.rect(self.display_surface, UI_BG_COLOR, bg_rect, 3)
+        current_rect.width = self._bar_width(current, max_amount, bg_rect)
         
-    def show_exp(self, exp):
-        # Display experience points in bottom-right corner.
-        text_surf = self.font.render(str(int(exp)), False, TEXT_COLOR)
-        x = self.display_surface.get_size()[0] - 20
-        y = self.display_surface.get_size()[1] - 20
-        text_rect = text_surf.get_rect(bottomright = (x, y))
+        self.layer.set_clip(bg_rect.inflate(-6, -6))
+        pygame.draw.rect(self.layer, color, current_rect)
+        self.layer.set_clip(None)
+        return bg_rect
     
+    def show_exp(self, exp, scheme):
+        # Display experience points in bottom-right corner, with the menu key label above.
+        text_surf = self._render_text(str(int(exp)), TEXT_COLOR, antialias=False)
+        x = self.screen_size[0] - 20
+        y = self.screen_size[1] - 20
+        text_rect = text_surf.get_rect(bottomright = (x, y))
+        
         box_rect = text_rect.inflate(20, 20)
-        pygame.draw.rect(self.display_surface, UI_BG_COLOR, box_rect)
-        self.display_surface.blit(text_surf, text_rect)
-        pygame.draw.rect(self.display_surface, UI_BORDER_COLOR, box_rect, 3)
-        return box_rect
+        pygame.draw.rect(self.layer, UI_BG_COLOR, box_rect)
+        self.layer.blit(text_surf, text_rect)
+        pygame.draw.rect(self.layer, UI_BORDER_COLOR, box_rect, 3)
+        
+        label = self._scheme_labels(scheme)['exp']
+        label_rect = label.get_rect(midbottom=(box_rect.centerx, box_rect.top - 4))
+        self.layer.blit(label, label_rect)
+        return box_rect.union(label_rect)
     
-    def selection_box(self, left, top, has_switched):
+    def selection_box(self, bg_rect, has_switched):
         # Draw selection box with highlight border if recently switched.
-        bg_rect = pygame.Rect(left, top, ITEM_BOX_SIZE, ITEM_BOX_SIZE)
-        pygame.draw.rect(self.display_surface, UI_BG_COLOR , bg_rect)
-        
-        if has_switched: 
-            pygame.draw.rect(self.display_surface, UI_BORDER_COLOR_ACTIVE , bg_rect, 3)
-        else:
-            pygame.draw.rect(self.display_surface, UI_BORDER_COLOR , bg_rect, 3) 
-            
+        self.layer.blit(self.box_frames[has_switched], bg_rect)
         return bg_rect
     
     def weapon_overlay(self, weapon_index, has_switched, scheme):
         # Display current weapon in selection box.
-        bg_rect = self.selection_box(10, 630, has_switched)
+        bg_rect = self.selection_box(self.weapon_box_rect, has_switched)
         weapon_surf = self.weapon_graphics[weapon_index]
         weapon_rect  = weapon_surf.get_rect(center = bg_rect.center )
-        self.display_surface.blit(weapon_surf, weapon_rect)
-        label = self._weapon_label_for_scheme(scheme)
-        self._draw_box_label(bg_rect, label)
-        return bg_rect
+        self.layer.blit(weapon_surf, weapon_rect)
+        return bg_rect.union(self._draw_box_label(bg_rect, self._scheme_labels(scheme)['weapon']))
     
     def magic_overlay(self, magic_index, has_switched, scheme):
         # Display current magic ability in selection box.
-        bg_rect_magic = self.selection_box(80, 635, has_switched)
+        bg_rect_magic = self.selection_box(self.magic_box_rect, has_switched)
         magic_surf = self.magic_graphics[magic_index]
         magic_rect = magic_surf.get_rect(center = bg_rect_magic.center)
-        self.display_surface.blit(magic_surf, magic_rect)
-        label = self._magic_label_for_scheme(scheme)
-        self._draw_box_label(bg_rect_magic, label)
-        return bg_rect_magic
-        
-    def _draw_box_label(self, box_rect, text):
-        label_surf = self.font.render(text, True, TEXT_COLOR)
-        label_rect = label_surf.get_rect(midtop=(box_rect.centerx, box_rect.bottom + 4))
-        pygame.draw.rect(self.display_surface, UI_BG_COLOR, label_rect.inflate(8, 4))
-        self.display_surface.blit(label_surf, label_rect)
-
+        self.layer.blit(magic_surf, magic_rect)
+        return bg_rect_magic.union(self._draw_box_label(bg_rect_magic, self._scheme_labels(scheme)['magic']))
+    
+    def _draw_box_label(self, box_rect, label):
+        label_rect = label.get_rect(midtop=(box_rect.centerx, box_rect.bottom + 2))
+        self.layer.blit(label, label_rect)
+        return label_rect
+    
     def _weapon_label_for_scheme(self, scheme):
         if scheme == 'gamepad':
             return 'X'
         if scheme == 'touch':
             return 'Tap'
         return 'K'
-
+    
     def _magic_label_for_scheme(self, scheme):
         if scheme == 'gamepad':
             return 'Y'
         if scheme == 'touch':
             return 'Tap'
         return 'L'
-
-    def _draw_exp_label(self, box_rect, scheme):
+    
+    def _exp_label_for_scheme(self, scheme):
         if scheme == 'gamepad':
-            text = 'Back'
-        elif scheme == 'touch':
-            text = 'Tap center'
-        else:
-            text = 'ESC'
-        label_surf = self.font.render(text, True, TEXT_COLOR)
-        label_rect = label_surf.get_rect(midbottom=(box_rect.centerx, box_rect.top - 6))
-        pygame.draw.rect(self.display_surface, UI_BG_COLOR, label_rect.inflate(8, 4))
-        self.display_surface.blit(label_surf, label_rect)
-
+            return 'Back'
+        if scheme == 'touch':
+            return 'Tap center'
+        return 'ESC'
+    
+    def _draw_part(self, name, key, draw):
+        # Redraw one HUD part if its key changed; returns True if it was redrawn.
+        if self._part_keys.get(name) == key:
+            return False
+        previous = self._part_rects.get(name)
+        if previous is not None:
+            self.layer.fill((0, 0, 0, 0), previous)
+        self._part_rects[name] = draw().clip(self.layer.get_rect())
+        self._part_keys[name] = key
+        return True
+    
     def display(self, player):
-        # Render all UI elements with current player stats.
-        self.show_bar(player.health, player.stats['health'], self.health_bar_rect, HEALTH_COLOR)
-        self.show_bar(player.energy, player.stats['energy'], self.energy_bar_rect, ENERGY_COLOR)
-        
+        # Render all UI elements with current player stats (each part redrawn only on change).
         scheme = self.input_manager.get_primary_scheme() if self.input_manager else None
-        exp_rect = self.show_exp(player.exp)
+        if scheme != self._scheme:
+            self._part_keys.clear()  # Labels changed
+            self._scheme = scheme
+        
+        health_width = self._bar_width(player.health, player.stats['health'], self.health_bar_rect)
+        energy_width = self._bar_width(player.energy, player.stats['energy'], self.energy_bar_rect)
+        redrawn = self._draw_part('bars', (health_width, energy_width), lambda: self.show_bar(
+            player.health, player.stats['health'], self.health_bar_rect, HEALTH_COLOR).union(self.show_bar(
+            player.energy, player.stats['energy'], self.energy_bar_rect, ENERGY_COLOR)))
+        
+        redrawn |= self._draw_part('exp', int(player.exp), lambda: self.show_exp(player.exp, scheme))
+        
+        items_key = (player.weapon_index, player.can_switch_weapon, player.magic_index, player.can_switch_magic)
+        redrawn |= self._draw_part('items', items_key, lambda: self.weapon_overlay(
+            player.weapon_index, not player.can_switch_weapon, scheme).union(self.magic_overlay(
+            player.magic_index, not player.can_switch_magic, scheme)))
+        
+        if redrawn:
+            self._layer_blits = [(self.layer.subsurface(region), region.topleft)
+                                 for region in self._part_rects.values() if region.width and region.height]
         
-        self.weapon_overlay(player.weapon_index, not player.can_switch_weapon, scheme)
-        self.magic_overlay(player.magic_index, not player.can_switch_magic, scheme)
-        self._draw_exp_label(exp_rect, scheme)
\ No newline at end of file
+        blit_batch(self.display_surface, self._layer_blits)
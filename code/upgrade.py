@@ -15,6 +15,14 @@ class Upgrade:
         self.max_values = list(player.max_stats.values())
         
         self.font = pygame.font.Font(UI_FONT, UI_FONT_SIZE)
+        self.notification_font = pygame.font.Font(None, 36)
+        
+        # Hint texts never change; render them once
+        self.quit_hint = self.font.render("Q - Quit", True, (255, 255, 255))
+        self.save_hint = self.font.render("Ctrl+S - Save Game", True, (255, 255, 255))
+        self.load_hint = self.font.render("Ctrl+L - Load Game", True, (255, 255, 255))
+        self._notification_surface = None
+        self._notification_surface_text = None
         
         # Calculate item dimensions
         self.height = self.display_surface.get_size()[1] * 0.8
@@ -125,14 +133,14 @@ class Upgrade:
 
     def _draw_quit_hint(self):
         # Display hint for quitting the upgrade menu.
-        hint_surface = self.font.render("Q - Quit", True, (255, 255, 255))
+        hint_surface = self.quit_hint
         hint_rect = hint_surface.get_rect(bottomright=(self.display_surface.get_size()[0] - 80, self.display_surface.get_size()[1] - 20))
         self.display_surface.blit(hint_surface, hint_rect)
         
     def _draw_keybind_hints(self):
         # Display save/load keybind hints.
-        save_hint = self.font.render("Ctrl+S - Save Game", True, (255, 255, 255))
-        load_hint = self.font.render("Ctrl+L - Load Game", True, (255, 255, 255))
+        save_hint = self.save_hint
+        load_hint = self.load_hint
         
         save_rect = save_hint.get_rect(
             bottomleft=(170, self.display_surface.get_size()[1] - 50)
@@ -148,9 +156,11 @@ class Upgrade:
         # Display save/load notification if active.
         current_time = pygame.time.get_ticks()
         if current_time < self.notification_time and self.notification_text:
-            # Set up font
-            font = pygame.font.Font(None, 36)
-            text_surface = font.render(self.notification_text, True, (255, 255, 255))
+            # Re-render only when the message changes
+            if self._notification_surface_text != self.notification_text:
+                self._notification_surface = self.notification_font.render(self.notification_text, True, (255, 255, 255))
+                self._notification_surface_text = self.notification_text
+            text_surface = self._notification_surface
             text_rect = text_surface.get_rect(center=(self.display_surface.get_width() // 2, 50))
             
             # Draw background
@@ -167,24 +177,28 @@ class Item:
         self.rect = pygame.Rect(l, t, w, h)
         self.index = index 
         self.font = font
+        
+        # Cached rendering, redrawn only when what the item shows changes
+        self.image = pygame.Surface(self.rect.size).convert()
+        self._image_key = None
     
-    def display_names(self, surface, name, cost, selected):
+    def display_names(self, surface, rect, name, cost, selected):
         # Render stat name and upgrade cost.
         color = TEXT_COLOR_SELECTED if selected else TEXT_COLOR
         
         title_surf = self.font.render(name, False, color)
-        title_rect = title_surf.get_rect(midtop = self.rect.midtop + pygame.math.Vector2(0,20))
+        title_rect = title_surf.get_rect(midtop = rect.midtop + pygame.math.Vector2(0,20))
         
         cost_surf = self.font.render(f'{int(cost)}', False, color)
-        cost_rect = cost_surf.get_rect(midbottom = self.rect.midbottom + pygame.math.Vector2(0,-20))
+        cost_rect = cost_surf.get_rect(midbottom = rect.midbottom + pygame.math.Vector2(0,-20))
         
         surface.blit(title_surf, title_rect)
         surface.blit(cost_surf, cost_rect)
         
-    def display_bar(self, surface, value, max_value, selected):
+    def display_bar(self, surface, rect, value, max_value, selected):
         # Draw vertical bar showing current stat level.
-        top = self.rect.midtop + pygame.math.Vector2(0,60)
-        bottom = self.rect.midbottom + pygame.math.Vector2(0,-60)
+        top = rect.midtop + pygame.math.Vector2(0,60)
+        bottom = rect.midbottom + pygame.math.Vector2(0,-60)
         color = BAR_COLOR_SELECTED if selected else BAR_COLOR
         
         # Calculate bar fill based on stat percentage
@@ -207,15 +221,25 @@ class Item:
             player.exp -= upgrade_cost
             player.upgrade_stat(stat_name)
             # Upgrade successful, no sound will be played
-            
-    def display(self, surface, selection_num, name, value, max_value, cost):
-        # Render complete upgrade item with background, border, and content.
-        if self.index == selection_num: 
-            pygame.draw.rect(surface, UPGRADE_BG_COLOR_SELECTED, self.rect)
-            pygame.draw.rect(surface, UI_BORDER_COLOR, self.rect, 4)
+    
+    def render(self, selected, name, value, max_value, cost):
+        # Redraw the cached item surface (background, border and content).
+        rect = self.image.get_rect()
+        if selected: 
+            pygame.draw.rect(self.image, UPGRADE_BG_COLOR_SELECTED, rect)
+            pygame.draw.rect(self.image, UI_BORDER_COLOR, rect, 4)
         else:
-            pygame.draw.rect(surface, UI_BG_COLOR, self.rect)
-            pygame.draw.rect(surface, UI_BORDER_COLOR, self.rect, 4)
+            pygame.draw.rect(self.image, UI_BG_COLOR, rect)
+            pygame.draw.rect(self.image, UI_BORDER_COLOR, rect, 4)
         
-        self.display_names(surface, name, cost, self.index == selection_num)
-        self.display_bar(surface, value, max_value, self.index == selection_num)
\ No newline at end of file
+        self.display_names(self.image, rect, name, cost, selected)
+        self.display_bar(self.image, rect, value, max_value, selected)
+            
+    def display(self, surface, selection_num, name, value, max_value, cost):
+        # Blit the upgrade item, re-rendering it only when selection, values or cost changed.
+        selected = self.index == selection_num
+        key = (selected, name, value, max_value, int(cost))
+        if key != self._image_key:
+            self.render(selected, name, value, max_value, cost)
+            self._image_key = key
+        surface.blit(self.image, self.rect)
@@ -0,0 +1,85 @@
+"""
+Wave Spawner - Arena mode enemy waves
+
+Spawns enemies from an EnemyPool in waves at the map's enemy spawn points.
+Pacing runs on the level's TimerService: one spawn every ARENA_SPAWN_INTERVAL
+ms until the wave is complete, then the next wave starts ARENA_WAVE_BREAK ms
+after the arena has been cleared. Each wave is ARENA_WAVE_GROWTH enemies
+larger than the previous one, and at most ARENA_MAX_ACTIVE enemies are alive
+at the same time.
+A map without enemy spawn points cannot host waves: the spawner then stays
+inactive instead of starting.
+"""
+
+import pygame
+from random import choice
+from settings import (ARENA_POOL_SIZE, ARENA_SPAWN_INTERVAL, ARENA_WAVE_BREAK,
+                      ARENA_FIRST_WAVE_SIZE, ARENA_WAVE_GROWTH, ARENA_MAX_ACTIVE)
+
+
+class WaveSpawner:
+
+    def __init__(self, level, pool, spawn_points, groups):
+        self.level = level
+        self.pool = pool
+        self.spawn_points = spawn_points
+        self.groups = groups
+        self.monster_names = list(ARENA_POOL_SIZE.keys())
+
+        self.wave = 0
+        self.remaining_in_wave = 0
+        self.active = False
+        self._timer = None
+
+    def start(self):
+        # Pre-warm the pools and schedule the first wave (no-op on maps without spawn points).
+        if not self.spawn_points:
+            return
+        for monster_name, count in ARENA_POOL_SIZE.items():
+            self.pool.prewarm(monster_name, count)
+        self.active = True
+        self._timer = self.level.timers.schedule(ARENA_WAVE_BREAK, self._start_wave, self.level.sim_time)
+
+    def stop(self):
+        self.active = False
+        self.level.timers.cancel(self._timer)
+        self._timer = None
+
+    def _start_wave(self):
+        self.wave += 1
+        self.remaining_in_wave = ARENA_FIRST_WAVE_SIZE + (self.wave - 1) * ARENA_WAVE_GROWTH
+        self._spawn_tick()
+
+    def _spawn_tick(self):
+        # Spawn one enemy and schedule the next tick of the current wave.
+        if not self.active:
+            return
+
+        if self.remaining_in_wave > 0:
+            if self.pool.active_count() < ARENA_MAX_ACTIVE:
+                self.pool.acquire(choice(self.monster_names), self._pick_spawn_point(), self.groups)
+                self.remaining_in_wave -= 1
+            self._timer = self.level.timers.schedule(ARENA_SPAWN_INTERVAL, self._spawn_tick, self.level.sim_time)
+        elif self.pool.active_count() == 0:
+            self._timer = self.level.timers.schedule(ARENA_WAVE_BREAK, self._start_wave, self.level.sim_time)
+        else:
+            # Wave fully spawned; wait for the arena to be cleared
+            self._timer = self.level.timers.schedule(ARENA_SPAWN_INTERVAL, self._spawn_tick, self.level.sim_time)
+
+    def _pick_spawn_point(self):
+        # Prefer spawn points outside the camera so enemies don't pop in on screen.
+        player = self.level.player
+        camera_rect = pygame.Rect((0, 0), self.level.world_surface.get_size())
+        camera_rect.center = player.rect.center
+
+        off_screen = [point for point in self.spawn_points if not camera_rect.collidepoint(point)]
+        return choice(off_screen or self.spawn_points)
+
+    def get_stats(self):
+        return {
+            'active': self.active,
+            'spawn_points': len(self.spawn_points),
+            'wave': self.wave,
+            'remaining_in_wave': self.remaining_in_wave,
+            'pool': self.pool.get_stats()
+        }
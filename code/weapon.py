@@ -1,17 +1,23 @@
 import pygame
 from debug import *
+from asset_registry import AssetRegistry
 
 class Weapon(pygame.sprite.Sprite):
     
+    image_offset = (0, 0)
+    
     def __init__(self, player, groups):
         super().__init__(groups)
         
         self.sprite_type = 'weapon'
+        self.reset(player)
+        
+    def reset(self, player):
+        # Take the graphic and position for the player's current weapon and facing.
         direction = player.status.split('_')[0]
         
-        # Load weapon graphic based on player direction
-        full_path = f'graphics/weapons/{player.weapon}/{direction}.png'
-        self.image = pygame.image.load(full_path).convert_alpha()
+        # Weapon graphic from the preloaded bank
+        self.image = AssetRegistry.weapon_images(player.weapon)[direction]
         
         # Position weapon relative to player based on attack direction
         if direction == 'right':
@@ -21,4 +27,4 @@ class Weapon(pygame.sprite.Sprite):
         elif direction == 'down':
             self.rect = self.image.get_rect(midtop = player.rect.midbottom + pygame.math.Vector2(-10,0))
         else:
-            self.rect = self.image.get_rect(midbottom = player.rect.midtop + pygame.math.Vector2(-10,0))
\ No newline at end of file
+            self.rect = self.image.get_rect(midbottom = player.rect.midtop + pygame.math.Vector2(-10,0))
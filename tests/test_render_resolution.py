@@ -0,0 +1,59 @@
+"""
+Render resolution - world surface clearing
+
+With RENDER_RESOLUTION set the world is drawn offscreen and upscaled over the
+whole display, so the offscreen surface must be cleared every frame: past the
+map edge nothing else paints over the previous frame's pixels.
+"""
+
+import os
+import sys
+import unittest
+
+os.environ.setdefault('SDL_VIDEODRIVER', 'dummy')
+os.environ.setdefault('SDL_AUDIODRIVER', 'dummy')
+
+ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+sys.path.insert(0, os.path.join(ROOT, 'code'))
+
+import pygame
+import level as level_module
+from settings import WIDTH, HEIGTH, WATER_COLOR
+
+
+class RenderResolutionTest(unittest.TestCase):
+
+    def setUp(self):
+        self._cwd = os.getcwd()
+        os.chdir(ROOT)  # Assets are loaded relative to the repository root
+        pygame.init()
+        pygame.display.set_mode((WIDTH, HEIGTH))
+        self._render_resolution = level_module.RENDER_RESOLUTION
+        level_module.RENDER_RESOLUTION = (WIDTH // 2, HEIGTH // 2)
+
+    def tearDown(self):
+        level_module.RENDER_RESOLUTION = self._render_resolution
+        pygame.quit()
+        os.chdir(self._cwd)
+
+    def test_area_past_map_corner_is_cleared(self):
+        level = level_module.Level()
+        self.assertIsNot(level.world_surface, level.display_surface)
+
+        # Park the player at the top-left map corner so the camera reaches past the floor
+        level.player.rect.topleft = (0, 0)
+        level.player.hitbox.center = level.player.rect.center
+        level.visible_sprites.dynamic_grid.move(level.player)
+
+        level.world_surface.fill('red')
+        for _ in range(3):
+            level.display_surface.fill(WATER_COLOR)  # What the main loop does each frame
+            level._render(1.0)
+
+        water = pygame.Color(WATER_COLOR)
+        self.assertEqual(level.world_surface.get_at((0, 0)), water)
+        self.assertEqual(level.display_surface.get_at((0, 0)), water)
+
+
+if __name__ == '__main__':
+    unittest.main()